@@ -1,9 +1,12 @@
 import asyncio
+import atexit
 import os
 import ssl
 import threading
 import time
 import tkinter as tk
+import weakref
+from functools import lru_cache
 from pathlib import Path
 from tkinter import filedialog
 
@@ -42,50 +45,107 @@ def read_env_vars(env_path: Path) -> dict:
     return env
 
 
-def update_env_var(env_path: Path, key: str, value: str):
-    lines = []
-    if env_path.exists():
-        with open(env_path, "r") as f:
-            for line in f:
-                if not line.startswith(f"{key}="):
-                    lines.append(line)
-    lines.append(f"{key}={value}\n")
-    with open(env_path, "w") as f:
-        f.writelines(lines)
+# Env files with edits that may still be pending. Held weakly, so widgets from re-run cells can be garbage collected.
+_env_files: "weakref.WeakSet[EnvFile]" = weakref.WeakSet()
+
+
+def _flush_env_files():
+    for env_file in list(_env_files):
+        env_file.flush()
+
+
+atexit.register(_flush_env_files)
+
+
+class EnvFile:
+    """Keep the saved widget state in memory, and write it to the .env file once edits pause.
+
+    Text widgets report every keystroke, so rather than rewriting the file on each change, writes are debounced
+    and coalesced into a single write. Only the lines for changed keys are replaced, any other lines are kept as is.
+    Pending changes are also written when the interpreter exits.
+    """
+
+    def __init__(self, env_path: Path, env_vars: dict, delay: float = 0.5):
+        self._env_path = env_path
+        self._env_vars = env_vars
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._pending: dict[str, str] = {}
+        _env_files.add(self)
+
+    def set(self, key: str, value: str):
+        with self._lock:
+            if self._env_vars.get(key) == value:
+                return
+            self._env_vars[key] = value
+            self._pending[key] = value
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self._delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            lines = []
+            if self._env_path.exists():
+                with open(self._env_path, "r") as f:
+                    lines = [line for line in f if line.split("=", 1)[0].strip() not in self._pending]
+            if lines and not lines[-1].endswith("\n"):
+                lines[-1] += "\n"
+            lines.extend(f"{k}={v}\n" for k, v in self._pending.items())
+            with open(self._env_path, "w") as f:
+                f.writelines(lines)
+            self._pending.clear()
 
 
 def format_hms(seconds: float) -> str:
-    seconds = int(seconds)
-    h = seconds // 3600
-    m = (seconds % 3600) // 60
-    s = seconds % 60
+    m, s = divmod(int(seconds), 60)
+    h, m = divmod(m, 60)
     return f"{h:02d}:{m:02d}:{s:02d}"
 
 
+@lru_cache(maxsize=256)
+def _crs_name_from_epsg(code: int) -> str:
+    # Looking up a CRS queries the PROJ database, and validation runs on every keystroke, so cache the result
+    from pyproj import CRS
+
+    return CRS.from_epsg(code).name
+
+
 def validate_epsg_code(code: str):
     """Validate an EPSG code string. Returns (is_valid, message)."""
     if not code:
         return False, "Enter EPSG code"
     try:
-        from pyproj import CRS
-
-        crs = CRS.from_epsg(int(code))
-        return True, f"Valid: {crs.name}"
+        return True, f"Valid: {_crs_name_from_epsg(int(code))}"
     except ValueError:
         return False, "Invalid: EPSG code must be a number"
     except Exception:
         return False, f"Invalid: EPSG:{code} not found"
 
 
-def open_duf_file_dialog() -> str | None:
-    """Open a file dialog to select a .duf file. Returns the path or None."""
+@lru_cache(maxsize=None)
+def _hidden_tk_root() -> tk.Tk:
+    # Starting Tk is slow, so create one hidden root the first time a dialog is opened and reuse it after that
     root = tk.Tk()
     root.withdraw()
     root.attributes("-topmost", True)
+    atexit.register(root.destroy)
+    return root
+
+
+def open_duf_file_dialog() -> str | None:
+    """Open a file dialog to select a .duf file. Returns the path or None."""
     file_path = filedialog.askopenfilename(
-        title="Select DUF File", filetypes=[("DUF Files", "*.duf"), ("All Files", "*.*")]
+        parent=_hidden_tk_root(), title="Select DUF File", filetypes=[("DUF Files", "*.duf"), ("All Files", "*.*")]
     )
-    root.destroy()
     return file_path or None
 
 
@@ -176,12 +236,13 @@ def run_timed_conversion(
     workspace_link.value = ""
 
     def tick():
-        while not stop_event.is_set():
+        # The timer only shows whole seconds, so wake up on each second boundary rather than re-rendering the
+        # label several times a second. Waiting on the stop event lets the thread exit as soon as the task is done.
+        while not stop_event.wait(1.0 - (time.time() - start_time) % 1.0):
             elapsed = time.time() - start_time
             timer_label.value = (
                 f"<span style='color:#0b74de;font-weight:600'>Converting... {format_hms(elapsed)}</span>"
             )
-            time.sleep(0.25)
 
     t = threading.Thread(target=tick, daemon=True)
     t.start()
@@ -274,6 +335,7 @@ async def create_duf_widget(manager, cache_location: str = "notebook-data"):
     env_file_path = Path(cache_location) / ".env"
     os.makedirs(cache_location, exist_ok=True)
     env_vars = read_env_vars(env_file_path)
+    env_file = EnvFile(env_file_path, env_vars)
 
     select_button, output_label, status_label, file_selection_box = create_file_selection_widgets()
     epsg_input, epsg_info, _, epsg_box = create_epsg_widgets()
@@ -300,14 +362,26 @@ async def create_duf_widget(manager, cache_location: str = "notebook-data"):
             update_summary()
             return
         epsg_info.value = "Validating..."
-        valid, msg = validate_epsg_code(code)
-        epsg_info.value = msg
-        epsg_info.style = {"text_color": "green" if valid else "red"}
-        state["epsg_valid"] = valid
-        if valid:
-            update_env_var(env_file_path, "EPSG_CODE", code)
+        epsg_info.style = {}
+        state["epsg_valid"] = False
         update_summary()
 
+        async def do_validate():
+            # Look the code up on a worker thread, so typing isn't held up by the PROJ database
+            loop = asyncio.get_running_loop()
+            valid, msg = await loop.run_in_executor(None, validate_epsg_code, code)
+            if epsg_input.value.strip() != code:
+                # The code has been edited since, and the newer validation will update the widgets
+                return
+            epsg_info.value = msg
+            epsg_info.style = {"text_color": "green" if valid else "red"}
+            state["epsg_valid"] = valid
+            if valid:
+                env_file.set("EPSG_CODE", code)
+            update_summary()
+
+        asyncio.run_coroutine_threadsafe(do_validate(), event_loop)
+
     def on_button_click(b):
         status_label.value = ""
         output_label.value = "Opening file dialog..."
@@ -327,7 +401,7 @@ async def create_duf_widget(manager, cache_location: str = "notebook-data"):
             update_summary()
             return
         state["selected_file_path"] = str(file_path)
-        update_env_var(env_file_path, "SELECTED_DUF_FILE", state["selected_file_path"])
+        env_file.set("SELECTED_DUF_FILE", state["selected_file_path"])
         output_label.value = f"Selected: {file_path.name}"
         status_label.value = "Valid DUF file"
         status_label.style = {"text_color": "green"}
@@ -335,7 +409,7 @@ async def create_duf_widget(manager, cache_location: str = "notebook-data"):
         update_summary()
 
     def on_object_path_change(change):
-        update_env_var(env_file_path, "OBJECT_PATH", change["new"] or "")
+        env_file.set("OBJECT_PATH", change["new"] or "")
         update_summary()
 
     epsg_input.observe(on_epsg_change, names="value")
@@ -390,6 +464,7 @@ async def create_duf_widget_advanced(manager, cache_location: str = "notebook-da
     env_file_path = Path(cache_location) / ".env"
     os.makedirs(cache_location, exist_ok=True)
     env_vars = read_env_vars(env_file_path)
+    env_file = EnvFile(env_file_path, env_vars)
 
     select_button, output_label, status_label, file_selection_box = create_file_selection_widgets()
     epsg_input, epsg_info, _, epsg_box = create_epsg_widgets()
@@ -434,14 +509,26 @@ async def create_duf_widget_advanced(manager, cache_location: str = "notebook-da
             update_summary()
             return
         epsg_info.value = "Validating..."
-        valid, msg = validate_epsg_code(code)
-        epsg_info.value = msg
-        epsg_info.style = {"text_color": "green" if valid else "red"}
-        state["epsg_valid"] = valid
-        if valid:
-            update_env_var(env_file_path, "EPSG_CODE", code)
+        epsg_info.style = {}
+        state["epsg_valid"] = False
         update_summary()
 
+        async def do_validate():
+            # Look the code up on a worker thread, so typing isn't held up by the PROJ database
+            loop = asyncio.get_running_loop()
+            valid, msg = await loop.run_in_executor(None, validate_epsg_code, code)
+            if epsg_input.value.strip() != code:
+                # The code has been edited since, and the newer validation will update the widgets
+                return
+            epsg_info.value = msg
+            epsg_info.style = {"text_color": "green" if valid else "red"}
+            state["epsg_valid"] = valid
+            if valid:
+                env_file.set("EPSG_CODE", code)
+            update_summary()
+
+        asyncio.run_coroutine_threadsafe(do_validate(), event_loop)
+
     def on_button_click(b):
         status_label.value = ""
         output_label.value = "Opening file dialog..."
@@ -461,7 +548,7 @@ async def create_duf_widget_advanced(manager, cache_location: str = "notebook-da
             update_summary()
             return
         state["selected_file_path"] = str(file_path)
-        update_env_var(env_file_path, "SELECTED_DUF_FILE", state["selected_file_path"])
+        env_file.set("SELECTED_DUF_FILE", state["selected_file_path"])
         output_label.value = f"Selected: {file_path.name}"
         status_label.value = "Valid DUF file"
         status_label.style = {"text_color": "green"}
@@ -471,7 +558,7 @@ async def create_duf_widget_advanced(manager, cache_location: str = "notebook-da
         update_summary()
 
     def on_object_path_change(change):
-        update_env_var(env_file_path, "OBJECT_PATH", change["new"] or "")
+        env_file.set("OBJECT_PATH", change["new"] or "")
         update_summary()
 
     epsg_input.observe(on_epsg_change, names="value")
@@ -11,7 +11,6 @@
 
 import asyncio
 
-import nest_asyncio
 from evo_schemas.components import BaseSpatialDataProperties_V1_0_1
 
 from evo.common.exceptions import NotFoundException
@@ -21,9 +20,13 @@ from evo.objects.data import ObjectMetadata
 from evo.objects.utils import ObjectDataClient
 
 from .generate_paths import generate_paths
+from .utils import allow_nested_event_loop
 
 logger = evo.logging.getLogger("data_converters")
 
+# Default limit on the number of objects uploaded at once, so large conversions don't flood the services with requests
+DEFAULT_MAX_CONCURRENT_PUBLISHES = 8
+
 
 def publish_geoscience_objects_sync(
     object_models: list[BaseSpatialDataProperties_V1_0_1],
@@ -31,24 +34,24 @@ def publish_geoscience_objects_sync(
     data_client: ObjectDataClient,
     path_prefix: str = "",
     overwrite_existing_objects: bool = False,
+    max_concurrent_publishes: int = DEFAULT_MAX_CONCURRENT_PUBLISHES,
 ) -> list[ObjectMetadata]:
     """
     Publishes a list of Geoscience Objects.
     """
-    objects_metadata = []
-    paths = generate_paths(object_models, path_prefix)
-
-    nest_asyncio.apply()
-
-    logger.debug(f"Preparing to publish {len(object_models)} objects to paths: {paths}")
-    for obj, obj_path in zip(object_models, paths):
-        object_metadata = asyncio.run(
-            publish_geoscience_object(obj_path, obj, object_service_client, data_client, overwrite_existing_objects)
+    allow_nested_event_loop()
+
+    # Run all the uploads in a single event loop, rather than starting a new loop for each object
+    return asyncio.run(
+        publish_geoscience_objects(
+            object_models,
+            object_service_client,
+            data_client,
+            path_prefix,
+            overwrite_existing_objects,
+            max_concurrent_publishes=max_concurrent_publishes,
         )
-        logger.debug(f"Got object metadata: {object_metadata}")
-        objects_metadata.append(object_metadata)
-
-    return objects_metadata
+    )
 
 
 async def publish_geoscience_objects(
@@ -57,22 +60,28 @@ async def publish_geoscience_objects(
     data_client: ObjectDataClient,
     path_prefix: str = "",
     overwrite_existing_objects: bool = False,
+    max_concurrent_publishes: int = DEFAULT_MAX_CONCURRENT_PUBLISHES,
 ) -> list[ObjectMetadata]:
     """
     Publishes a list of Geoscience Objects.
+
+    The objects are published concurrently, with at most max_concurrent_publishes in flight at once. The returned
+    metadata is in the same order as object_models.
     """
-    objects_metadata = []
     paths = generate_paths(object_models, path_prefix)
+    semaphore = asyncio.Semaphore(max_concurrent_publishes)
+
+    async def _publish(obj_path: str, obj: BaseSpatialDataProperties_V1_0_1) -> ObjectMetadata:
+        async with semaphore:
+            return await publish_geoscience_object(
+                obj_path, obj, object_service_client, data_client, overwrite_existing_objects
+            )
 
     logger.debug(f"Preparing to publish {len(object_models)} objects to paths: {paths}")
-    for obj, obj_path in zip(object_models, paths):
-        object_metadata = await publish_geoscience_object(
-            obj_path, obj, object_service_client, data_client, overwrite_existing_objects
-        )
-        logger.debug(f"Got object metadata: {object_metadata}")
-        objects_metadata.append(object_metadata)
+    objects_metadata = await asyncio.gather(*(_publish(obj_path, obj) for obj, obj_path in zip(object_models, paths)))
+    logger.debug(f"Got objects metadata: {objects_metadata}")
 
-    return objects_metadata
+    return list(objects_metadata)
 
 
 async def publish_geoscience_object(
@@ -93,9 +102,12 @@ async def publish_geoscience_object(
     except NotFoundException:
         pass
 
-    await data_client.upload_referenced_data(object_model.as_dict())
+    # Serialise the object once, after its UUID has been resolved, and share it between the data upload and the
+    # object create or update
+    object_dict = object_model.as_dict()
+    await data_client.upload_referenced_data(object_dict)
     if overwrite_existing_object and object_model.uuid is not None:
-        object_metadata = await object_service_client.update_geoscience_object(object_model.as_dict())
+        object_metadata = await object_service_client.update_geoscience_object(object_dict)
     else:
-        object_metadata = await object_service_client.create_geoscience_object(path, object_model.as_dict())
+        object_metadata = await object_service_client.create_geoscience_object(path, object_dict)
     return object_metadata
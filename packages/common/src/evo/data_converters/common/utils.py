@@ -9,17 +9,31 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
 from typing import Any
 
+import nest_asyncio
 import numpy as np
 from evo_schemas.components import BoundingBox_V1_0_1, Rotation_V1_1_0
 from numpy.typing import NDArray
 from scipy.spatial.transform import Rotation
 
 
+# Number of vertices reduced at a time by vertices_bounding_box, small enough for each tile to stay in cache
+_BOUNDING_BOX_TILE_ROWS = 1 << 14
+
+
 def vertices_bounding_box(vertices: NDArray[Any]) -> BoundingBox_V1_0_1:
-    bbox_min = np.min(vertices, axis=0)
-    bbox_max = np.max(vertices, axis=0)
+    # Reducing an (N, 3) array along axis 0 walks it with a stride of 3, which defeats vectorisation. Instead, work
+    # through it in tiles, transposing each one into contiguous x, y and z rows while it is in cache, and reduce those.
+    vertices = np.asarray(vertices)
+    tile = np.ascontiguousarray(vertices[:_BOUNDING_BOX_TILE_ROWS].T)
+    bbox_min = tile.min(axis=1)
+    bbox_max = tile.max(axis=1)
+    for start in range(_BOUNDING_BOX_TILE_ROWS, len(vertices), _BOUNDING_BOX_TILE_ROWS):
+        tile = np.ascontiguousarray(vertices[start : start + _BOUNDING_BOX_TILE_ROWS].T)
+        np.minimum(bbox_min, tile.min(axis=1), out=bbox_min)
+        np.maximum(bbox_max, tile.max(axis=1), out=bbox_max)
 
     return BoundingBox_V1_0_1(
         min_x=float(bbox_min[0]),
@@ -118,3 +132,17 @@ def get_object_tags(path: str, input_type: str, extra_tags: dict = None) -> dict
         "InputType": input_type,
         **(extra_tags if extra_tags else {}),
     }
+
+
+def allow_nested_event_loop() -> None:
+    """Allow asyncio.run() to be called from synchronous code that is itself running inside an event loop, such as a
+    converter called from a Jupyter notebook cell.
+
+    nest_asyncio patches asyncio globally, which adds overhead to every await and rules out other event loops such as
+    uvloop, so it is only applied when there is already a running loop to nest in. Plain scripts are left unpatched.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    nest_asyncio.apply()
@@ -9,11 +9,16 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
 
 from evo.common.exceptions import NotFoundException
-from evo.data_converters.common.publish import publish_geoscience_object, publish_geoscience_objects_sync
+from evo.data_converters.common.publish import (
+    publish_geoscience_object,
+    publish_geoscience_objects,
+    publish_geoscience_objects_sync,
+)
 
 
 class TestPublishGeoscienceObjects(IsolatedAsyncioTestCase):
@@ -67,6 +72,31 @@ class TestPublishGeoscienceObjects(IsolatedAsyncioTestCase):
         self.assertEqual(objects_metadata, [])
         mock_publish_geoscience_object.assert_not_called()
 
+    @patch("evo.data_converters.common.publish.generate_paths")
+    async def test_publish_geoscience_objects_limits_concurrency(self, mock_generate_paths: MagicMock) -> None:
+        mock_generate_paths.return_value = [f"test/mock_{i}.json" for i in range(5)]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def publish(path: str, *args: object) -> str:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return path
+
+        with patch("evo.data_converters.common.publish.publish_geoscience_object", side_effect=publish):
+            objects_metadata = await publish_geoscience_objects(
+                [self.test_object] * 5,
+                self.mock_object_service_client,
+                self.mock_data_client,
+                max_concurrent_publishes=2,
+            )
+
+        self.assertEqual(objects_metadata, mock_generate_paths.return_value)
+        self.assertEqual(max_in_flight, 2)
+
     async def test_publish_geoscience_object_creates_new_object(self) -> None:
         """Test publishing when object doesn't exist (404 NotFound)"""
         object_path = "test/object_1.json"
@@ -90,6 +120,7 @@ class TestPublishGeoscienceObjects(IsolatedAsyncioTestCase):
         )
 
         assert object_metadata == expected_metadata
+        self.test_object.as_dict.assert_called_once_with()
 
         # Verify the correct methods were called
         self.mock_object_service_client.download_object_by_path.assert_awaited_once_with(object_path)
@@ -125,6 +156,7 @@ class TestPublishGeoscienceObjects(IsolatedAsyncioTestCase):
         )
 
         assert object_metadata == expected_metadata
+        self.test_object.as_dict.assert_called_once_with()
 
         self.mock_object_service_client.download_object_by_path.assert_awaited_once_with(object_path)
 
@@ -9,14 +9,22 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from unittest import TestCase
+import asyncio
+from unittest import TestCase, mock
 
 import numpy as np
 import pytest
 from evo_schemas.components import BoundingBox_V1_0_1
 from scipy.spatial.transform import Rotation
 
-from evo.data_converters.common.utils import convert_rotation, get_object_tags, grid_bounding_box, vertices_bounding_box
+from evo.data_converters.common.utils import (
+    _BOUNDING_BOX_TILE_ROWS,
+    allow_nested_event_loop,
+    convert_rotation,
+    get_object_tags,
+    grid_bounding_box,
+    vertices_bounding_box,
+)
 
 
 class TestUtils(TestCase):
@@ -46,6 +54,22 @@ class TestUtils(TestCase):
         self.assertEqual(500, bb.max_y)
         self.assertEqual(600, bb.max_z)
 
+    def test_vertices_bounding_box_multiple_tiles(self) -> None:
+        # given a points array spanning several tiles, with the extremes in different tiles
+        rng = np.random.default_rng(42)
+        points = rng.random((3 * _BOUNDING_BOX_TILE_ROWS + 5, 3))
+        points[7, 0] = -10.0
+        points[_BOUNDING_BOX_TILE_ROWS + 3, 1] = 20.0
+        points[-1, 2] = -30.0
+
+        # Then vertices_bounding_box matches a plain reduction over the whole array
+        bb = vertices_bounding_box(points)
+        self.assertEqual(
+            (bb.min_x, bb.min_y, bb.min_z, bb.max_x, bb.max_y, bb.max_z),
+            (*points.min(axis=0), *points.max(axis=0)),
+        )
+        self.assertEqual((-10.0, 20.0, -30.0), (bb.min_x, bb.max_y, bb.min_z))
+
 
 @pytest.mark.parametrize(
     "angles, dip_azimuth, dip, pitch",
@@ -130,3 +154,18 @@ def test_get_object_tags_with_extra_tags_provided_taking_precedence() -> None:
         "InputType": "SomethingElse",
         "foo": "bar",
     }
+
+
+def test_allow_nested_event_loop_without_running_loop() -> None:
+    with mock.patch("evo.data_converters.common.utils.nest_asyncio.apply") as mock_apply:
+        allow_nested_event_loop()
+    mock_apply.assert_not_called()
+
+
+def test_allow_nested_event_loop_with_running_loop() -> None:
+    async def _in_loop() -> None:
+        allow_nested_event_loop()
+
+    with mock.patch("evo.data_converters.common.utils.nest_asyncio.apply") as mock_apply:
+        asyncio.run(_in_loop())
+    mock_apply.assert_called_once_with()
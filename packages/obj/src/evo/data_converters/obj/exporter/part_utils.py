@@ -10,10 +10,28 @@
 #  limitations under the License.
 
 from dataclasses import dataclass
+from importlib.util import find_spec
 
 import numpy as np
 import numpy.typing as npt
 
+if find_spec("numba") is not None:
+    from numba import njit
+
+    @njit(cache=True, boundscheck=False)
+    def _unpack_chunks_numba(data: npt.NDArray, chunks: npt.NDArray, out: npt.NDArray) -> None:
+        w = 0
+        for i in range(chunks.shape[0]):
+            start = chunks[i, 0]
+            count = chunks[i, 1]
+            for j in range(count):
+                out[w, :] = data[start + j, :]
+                w += 1
+
+    HAS_NUMBA = True
+else:
+    HAS_NUMBA = False
+
 
 class PackedData:
     def __len__(self) -> int:
@@ -57,6 +75,19 @@ class ChunkedData(PackedData):
             `[11,12,13]` is omitted as it is not part of a chunk.
         """
         data = self._empty_array_from(self.data)
+
+        # The chunks come from downloaded objects, so check they stay within the data. The numba kernel doesn't bounds
+        # check, and slicing a chunk that runs off the end can broadcast rows rather than fail.
+        if self.chunks.ndim == 2 and len(self.chunks) > 0:
+            starts, counts = self.chunks[:, 0], self.chunks[:, 1]
+            if not ((starts >= 0).all() and (counts >= 0).all() and (starts + counts <= len(self.data)).all()):
+                raise ValueError(f"Chunks extend outside of the data, which has {len(self.data)} rows")
+
+        # With numba installed, walk the chunks in a single compiled pass rather than slicing per chunk in Python
+        if HAS_NUMBA and self.chunks.ndim == 2 and self.data.ndim == 2 and len(data) > 0:
+            _unpack_chunks_numba(self.data, self.chunks, data)
+            return data
+
         i = 0
 
         for chunk in self.chunks:
@@ -9,10 +9,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from unittest import TestCase
+from unittest import TestCase, mock
 
 import numpy as np
 
+from evo.data_converters.obj.exporter import part_utils
 from evo.data_converters.obj.exporter.part_utils import ChunkedData, IndexedData
 
 
@@ -53,6 +54,28 @@ class TestChunkedData(PackedDataBaseTestCase):
 
         self.assertEqual(result.tolist(), [])
 
+    def _unpack_paths(self) -> list[bool]:
+        return [False, True] if part_utils.HAS_NUMBA else [False]
+
+    def test_chunked_data_with_and_without_numba(self) -> None:
+        chunks = np.array([[0, 3], [1, 2], [2, 3]])
+        expected = [[0, 2, 3], [4, 5, 6], [7, 8, 9], [4, 5, 6], [7, 8, 9], [7, 8, 9], [20, 23, 24], [45, 46, 47]]
+
+        for use_numba in self._unpack_paths():
+            with self.subTest(use_numba=use_numba), mock.patch.object(part_utils, "HAS_NUMBA", use_numba):
+                result = ChunkedData(data=self.data, chunks=chunks).unpack()
+                self.assertEqual(result.tolist(), expected)
+
+    def test_chunked_data_out_of_bounds_with_and_without_numba(self) -> None:
+        for chunks in (np.array([[3, 5]]), np.array([[-1, 2]]), np.array([[0, 2], [4, 2]])):
+            for use_numba in self._unpack_paths():
+                with (
+                    self.subTest(chunks=chunks.tolist(), use_numba=use_numba),
+                    mock.patch.object(part_utils, "HAS_NUMBA", use_numba),
+                ):
+                    with self.assertRaises(ValueError):
+                        ChunkedData(data=self.data, chunks=chunks).unpack()
+
 
 class TestIndexedData(PackedDataBaseTestCase):
     def test_indexed_data(self) -> None:
@@ -30,42 +30,57 @@ from evo.objects.utils.tables import KnownTableFormat
 
 # Specify the simple_shapes.obj in terms of its faces, as different parsers format the faces and vertices
 # in different orders, but the total set of vertices and faces should always be there.
-simple_shape_faces = pd.DataFrame(
-    columns=["object", "n0", "n1", "n2"],
-    data=[
-        # ---- Cube ----
-        ("Cube", (174.79, -41.29, -0.5), (175.29, -41.29, -0.5), (175.29, -40.79, -0.5)),
-        ("Cube", (174.79, -41.29, -0.5), (175.29, -40.79, -0.5), (174.79, -40.79, -0.5)),
-        ("Cube", (174.79, -41.29, 0.5), (174.79, -40.79, 0.5), (175.29, -40.79, 0.5)),
-        ("Cube", (174.79, -41.29, 0.5), (175.29, -40.79, 0.5), (175.29, -41.29, 0.5)),
-        ("Cube", (174.79, -41.29, -0.5), (174.79, -41.29, 0.5), (175.29, -41.29, 0.5)),
-        ("Cube", (174.79, -41.29, -0.5), (175.29, -41.29, 0.5), (175.29, -41.29, -0.5)),
-        ("Cube", (175.29, -41.29, -0.5), (175.29, -41.29, 0.5), (175.29, -40.79, 0.5)),
-        ("Cube", (175.29, -41.29, -0.5), (175.29, -40.79, 0.5), (175.29, -40.79, -0.5)),
-        ("Cube", (175.29, -40.79, -0.5), (175.29, -40.79, 0.5), (174.79, -40.79, 0.5)),
-        ("Cube", (175.29, -40.79, -0.5), (174.79, -40.79, 0.5), (174.79, -40.79, -0.5)),
-        ("Cube", (174.79, -40.79, -0.5), (174.79, -40.79, 0.5), (174.79, -41.29, 0.5)),
-        ("Cube", (174.79, -40.79, -0.5), (174.79, -41.29, 0.5), (174.79, -41.29, -0.5)),
-        # ---- Pyramid ----
-        ("Pyramid", (174.79, -41.29, 1.0), (175.29, -41.29, 1.0), (175.04, -40.79, 1.0)),
-        ("Pyramid", (174.79, -41.29, 1.0), (175.04, -40.79, 1.0), (174.54, -40.79, 1.0)),
-        ("Pyramid", (174.79, -41.29, 1.0), (175.29, -41.29, 1.0), (174.915, -41.045, 2.0)),
-        ("Pyramid", (175.29, -41.29, 1.0), (175.04, -40.79, 1.0), (174.915, -41.045, 2.0)),
-        ("Pyramid", (175.04, -40.79, 1.0), (174.54, -40.79, 1.0), (174.915, -41.045, 2.0)),
-        ("Pyramid", (174.54, -40.79, 1.0), (174.79, -41.29, 1.0), (174.915, -41.045, 2.0)),
-    ],
-)
+_simple_shape_face_rows = [
+    # ---- Cube ----
+    ("Cube", (174.79, -41.29, -0.5), (175.29, -41.29, -0.5), (175.29, -40.79, -0.5)),
+    ("Cube", (174.79, -41.29, -0.5), (175.29, -40.79, -0.5), (174.79, -40.79, -0.5)),
+    ("Cube", (174.79, -41.29, 0.5), (174.79, -40.79, 0.5), (175.29, -40.79, 0.5)),
+    ("Cube", (174.79, -41.29, 0.5), (175.29, -40.79, 0.5), (175.29, -41.29, 0.5)),
+    ("Cube", (174.79, -41.29, -0.5), (174.79, -41.29, 0.5), (175.29, -41.29, 0.5)),
+    ("Cube", (174.79, -41.29, -0.5), (175.29, -41.29, 0.5), (175.29, -41.29, -0.5)),
+    ("Cube", (175.29, -41.29, -0.5), (175.29, -41.29, 0.5), (175.29, -40.79, 0.5)),
+    ("Cube", (175.29, -41.29, -0.5), (175.29, -40.79, 0.5), (175.29, -40.79, -0.5)),
+    ("Cube", (175.29, -40.79, -0.5), (175.29, -40.79, 0.5), (174.79, -40.79, 0.5)),
+    ("Cube", (175.29, -40.79, -0.5), (174.79, -40.79, 0.5), (174.79, -40.79, -0.5)),
+    ("Cube", (174.79, -40.79, -0.5), (174.79, -40.79, 0.5), (174.79, -41.29, 0.5)),
+    ("Cube", (174.79, -40.79, -0.5), (174.79, -41.29, 0.5), (174.79, -41.29, -0.5)),
+    # ---- Pyramid ----
+    ("Pyramid", (174.79, -41.29, 1.0), (175.29, -41.29, 1.0), (175.04, -40.79, 1.0)),
+    ("Pyramid", (174.79, -41.29, 1.0), (175.04, -40.79, 1.0), (174.54, -40.79, 1.0)),
+    ("Pyramid", (174.79, -41.29, 1.0), (175.29, -41.29, 1.0), (174.915, -41.045, 2.0)),
+    ("Pyramid", (175.29, -41.29, 1.0), (175.04, -40.79, 1.0), (174.915, -41.045, 2.0)),
+    ("Pyramid", (175.04, -40.79, 1.0), (174.54, -40.79, 1.0), (174.915, -41.045, 2.0)),
+    ("Pyramid", (174.54, -40.79, 1.0), (174.79, -41.29, 1.0), (174.915, -41.045, 2.0)),
+]
+
+# The same faces laid out as contiguous arrays: FACE_COORDS has shape (n_faces, 3 vertices, 3 coordinates) and
+# FACE_OBJECT names the object each face belongs to.
+FACE_COORDS = np.array([[n0, n1, n2] for _, n0, n1, n2 in _simple_shape_face_rows], dtype=np.float64)
+FACE_OBJECT = np.array([row[0] for row in _simple_shape_face_rows])
 
 
 class TestObjGeometryParsing(EvoDataConvertersTestCase):
     implementation: str = "trimesh"
 
+    # Converted objects, keyed by cache directory and file name. The tests only read the converted object, so each file
+    # is parsed once per test class and the tables it saved are reused from the class-level cache directory.
+    _geoobject_cache: dict[tuple[Path, str], TriangleMesh_V2_2_0]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._geoobject_cache = {}
+
     def setUp(self) -> None:
         EvoDataConvertersTestCase.setUp(self)
         _, data_client = create_evo_object_service_and_data_client(self.workspace_metadata)
         self.data_client = data_client
 
     async def _make_geoobject(self, filename: str = "simple_shapes.obj") -> TriangleMesh_V2_2_0:
+        cache_key = (self.CACHE_DIR, filename)
+        if cache_key in self._geoobject_cache:
+            return self._geoobject_cache[cache_key]
+
         obj_file = Path(__file__).parent.parent / "data" / "simple_shapes" / filename
 
         (triangle_mesh,) = await convert_obj(
@@ -76,6 +91,7 @@ class TestObjGeometryParsing(EvoDataConvertersTestCase):
             implementation=self.implementation,
         )
 
+        self._geoobject_cache[cache_key] = triangle_mesh
         return triangle_mesh
 
     def _get_dataframe_for_table(self, table_info: dict) -> pd.DataFrame:
@@ -117,67 +133,52 @@ class TestObjGeometryParsing(EvoDataConvertersTestCase):
     async def test_correct_vertices(self) -> None:
         triangle_mesh = await self._make_geoobject()
         vertices = self._get_dataframe_for_table(triangle_mesh.triangles.vertices).drop_duplicates()
+        self._assert_vertices_match(vertices)
 
-        # Extract the unique set of vertices from the faces and make sure all those vertices exist in the table
-        correct_vertices = pd.Series(simple_shape_faces[["n0", "n1", "n2"]].values.ravel()).drop_duplicates()
-        matches: list[bool] = []
-        for vertex in correct_vertices:
-            found = False
-            for _, vertex2 in vertices.iterrows():
-                if np.allclose(vertex, vertex2):
-                    found = True
-                    break
-            matches.append(found)
+    def _assert_vertices_match(self, vertices: pd.DataFrame) -> None:
+        """
+        Extract the unique set of vertices from the faces and make sure all those vertices exist in the table.
+        """
+        correct_vertices = np.unique(FACE_COORDS.reshape(-1, 3), axis=0)
+        vertex_coords = vertices[["x", "y", "z"]].to_numpy(dtype=np.float64)
+
+        close = np.isclose(correct_vertices[:, np.newaxis, :], vertex_coords[np.newaxis, :, :]).all(axis=2)
+        matches = close.any(axis=1)
 
         intersection = correct_vertices[matches]
         assert len(intersection) == len(vertices)
         assert len(correct_vertices) == len(vertices)
 
-    def _make_face_vertices_sets(self, vertices: pd.DataFrame, faces: pd.DataFrame) -> pd.Series:
+    def _make_face_vertices_sets(self, vertices: pd.DataFrame, faces: pd.DataFrame) -> np.ndarray:
         """
         Zips a faces frame of n0/n1/n2 vertices references to a vertices frame by row reference,
-        making a new Series that contains all the triples of x/y/z coordinates.
+        making a new (n_faces, 3, 3) array that contains all the triples of x/y/z coordinates.
         """
-        face_rows = []
-        for _, face in faces.iterrows():
-            face_rows.append(
-                (
-                    tuple(vertices.iloc[face["n0"]][["x", "y", "z"]].values),
-                    tuple(vertices.iloc[face["n1"]][["x", "y", "z"]].values),
-                    tuple(vertices.iloc[face["n2"]][["x", "y", "z"]].values),
-                )
-            )
-        return pd.Series(face_rows)
+        vertex_coords = vertices[["x", "y", "z"]].to_numpy(dtype=np.float64)
+        return vertex_coords[faces[["n0", "n1", "n2"]].to_numpy()]
 
-    def _compare_face_sets(self, faces1: pd.Series, faces2: pd.Series) -> bool:
+    def _compare_face_sets(self, faces1: np.ndarray, faces2: np.ndarray) -> bool:
         """
-        Helper that takes two Series where each element is a face triple of x/y/z tuples
-        returning True if the two Series are equivalent (with fuzzy float comparison).
+        Helper that takes two (n_faces, 3, 3) arrays where each element is a face triple of x/y/z coordinates,
+        returning True if the two arrays are equivalent (with fuzzy float comparison).
         """
-        matches = []
-        for face1 in faces1:
-            found = False
-            for face2 in faces2:
-                if np.allclose(np.sort(face1, axis=0), np.sort(face2, axis=0), atol=1e-3):
-                    found = True
-                    break
-            matches.append(found)
-
-        intersection = faces1[matches]
-        return len(intersection) == len(faces2) == len(faces1)
+        if len(faces1) != len(faces2):
+            return False
+
+        sorted1 = np.sort(faces1, axis=1)
+        sorted2 = np.sort(faces2, axis=1)
+        close = np.isclose(sorted1[:, np.newaxis], sorted2[np.newaxis, :], atol=1e-3).all(axis=(2, 3))
+        return bool(close.any(axis=1).all())
 
     async def test_correct_faces(self) -> None:
         triangle_mesh = await self._make_geoobject()
         faces = self._get_dataframe_for_table(triangle_mesh.triangles.indices)
         vertices = self._get_dataframe_for_table(triangle_mesh.triangles.vertices)
-        assert len(faces) == len(simple_shape_faces), "Check number of faces is correct"
+        assert len(faces) == len(FACE_COORDS), "Check number of faces is correct"
 
         face_vertex_sets = self._make_face_vertices_sets(vertices, faces)
 
-        # Produce an equivalent set of the correct faces
-        correct_face_vertex_sets = simple_shape_faces[["n0", "n1", "n2"]].apply(lambda r: tuple(r), axis=1)
-
-        assert self._compare_face_sets(face_vertex_sets, correct_face_vertex_sets), (
+        assert self._compare_face_sets(face_vertex_sets, FACE_COORDS), (
             "Check all faces have the right triple of vertices"
         )
 
@@ -189,27 +190,21 @@ class TestObjGeometryParsing(EvoDataConvertersTestCase):
 
         assert len(chunks) == 2, "Cube and Pyramid should form two chunks"
 
-        # We now need to slice up the triangles table chunk by chunk to ensure they have the right vertices
-        for _, chunk in chunks.iterrows():
-            chunk_indices = faces.iloc[chunk["offset"] : chunk["offset"] + chunk["count"]]
-            assert len(chunk_indices) == chunk["count"]
+        # Build the face coordinates once, then slice them up chunk by chunk to ensure they have the right vertices
+        face_vertex_sets = self._make_face_vertices_sets(vertices, faces)
+
+        for offset, count in zip(chunks["offset"], chunks["count"]):
+            part = face_vertex_sets[offset : offset + count]
+            assert len(part) == count
 
-            if len(chunk_indices) == 12:
+            if len(part) == 12:
                 # This should match the cube faces
-                cube_vertex_sets = self._make_face_vertices_sets(vertices, chunk_indices)
-                correct_cube_vertex_sets = simple_shape_faces[simple_shape_faces["object"] == "Cube"][
-                    ["n0", "n1", "n2"]
-                ].apply(lambda r: tuple(r), axis=1)
-                assert self._compare_face_sets(cube_vertex_sets, correct_cube_vertex_sets), (
+                assert self._compare_face_sets(part, FACE_COORDS[FACE_OBJECT == "Cube"]), (
                     "Check the Cube part has the right vertices"
                 )
             else:
                 # This should match the pyramid faces
-                pyramid_vertex_sets = self._make_face_vertices_sets(vertices, chunk_indices)
-                correct_pyramid_vertex_sets = simple_shape_faces[simple_shape_faces["object"] == "Pyramid"][
-                    ["n0", "n1", "n2"]
-                ].apply(lambda r: tuple(r), axis=1)
-                assert self._compare_face_sets(pyramid_vertex_sets, correct_pyramid_vertex_sets), (
+                assert self._compare_face_sets(part, FACE_COORDS[FACE_OBJECT == "Pyramid"]), (
                     "Check the Pyramid part has the right vertices"
                 )
 
@@ -221,20 +216,7 @@ class TestObjGeometryParsing(EvoDataConvertersTestCase):
 
         # Perform the same vertices check as test_correct_vertices() as at least the vertices shouldn't have moved
         vertices = self._get_dataframe_for_table(triangle_mesh.triangles.vertices).drop_duplicates()
-
-        correct_vertices = pd.Series(simple_shape_faces[["n0", "n1", "n2"]].values.ravel()).drop_duplicates()
-        matches: list[bool] = []
-        for vertex in correct_vertices:
-            found = False
-            for _, vertex2 in vertices.iterrows():
-                if np.allclose(vertex, vertex2):
-                    found = True
-                    break
-            matches.append(found)
-
-        intersection = correct_vertices[matches]
-        assert len(intersection) == len(vertices)
-        assert len(correct_vertices) == len(vertices)
+        self._assert_vertices_match(vertices)
 
     async def test_mesh_with_texture_coordinates(self) -> None:
         """
@@ -243,14 +225,11 @@ class TestObjGeometryParsing(EvoDataConvertersTestCase):
         triangle_mesh = await self._make_geoobject(filename="simple_shapes_texture_coordinates.obj")
         faces = self._get_dataframe_for_table(triangle_mesh.triangles.indices)
         vertices = self._get_dataframe_for_table(triangle_mesh.triangles.vertices)
-        assert len(faces) == len(simple_shape_faces), "Check number of faces is correct"
+        assert len(faces) == len(FACE_COORDS), "Check number of faces is correct"
 
         face_vertex_sets = self._make_face_vertices_sets(vertices, faces)
 
-        # Produce an equivalent set of the correct faces
-        correct_face_vertex_sets = simple_shape_faces[["n0", "n1", "n2"]].apply(lambda r: tuple(r), axis=1)
-
-        assert self._compare_face_sets(face_vertex_sets, correct_face_vertex_sets), (
+        assert self._compare_face_sets(face_vertex_sets, FACE_COORDS), (
             "Check all faces have the right triple of vertices"
         )
 
@@ -14,7 +14,6 @@ from datetime import datetime, time, timezone
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-import nest_asyncio
 import numpy as np
 import numpy.typing as npt
 import omf
@@ -28,6 +27,7 @@ from scipy.spatial.transform import Rotation as R
 import evo.logging
 from evo.common import APIConnector, Environment
 from evo.data_converters.common import BlockSyncClient, EvoWorkspaceMetadata, create_evo_object_service_and_data_client
+from evo.data_converters.common.utils import allow_nested_event_loop
 
 logger = evo.logging.getLogger("data_converters")
 
@@ -46,7 +46,7 @@ def export_blocksync_omf(
     evo_workspace_metadata: EvoWorkspaceMetadata = None,
     service_manager_widget: Optional["ServiceManagerWidget"] = None,
 ) -> None:
-    nest_asyncio.apply()
+    allow_nested_event_loop()
 
     logger.info("Creating service and data clients for interacting with BlockSync.")
     service_client, data_client = create_evo_object_service_and_data_client(
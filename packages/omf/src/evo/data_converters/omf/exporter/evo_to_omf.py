@@ -11,10 +11,9 @@
 
 import asyncio
 import dataclasses
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 from uuid import UUID
 
-import nest_asyncio
 import omf
 from evo_schemas import schema_lookup
 from evo_schemas.objects import (
@@ -32,6 +31,7 @@ from evo.data_converters.common import (
     EvoWorkspaceMetadata,
     create_evo_object_service_and_data_client,
 )
+from evo.data_converters.common.utils import allow_nested_event_loop
 from evo.objects.client import ObjectAPIClient
 from evo.objects.data import ObjectSchema
 from evo.objects.utils.data import ObjectDataClient
@@ -55,28 +55,55 @@ class UnsupportedObjectError(OMFExporterException):
 
 logger = evo.logging.getLogger("data_converters")
 
+# Limit on the number of objects downloaded at once, so large exports don't flood the service with requests
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 8
 
-def _download_evo_object_by_id(
+# The OMF element exporter for each supported Geoscience Object class
+_EXPORTERS: dict[type, Callable[[UUID, Optional[str], Any, ObjectDataClient], omf.base.ProjectElement]] = {
+    TriangleMesh_V2_0_0: export_omf_surface,
+    TriangleMesh_V2_1_0: export_omf_surface,
+    LineSegments_V2_0_0: export_omf_lineset,
+    LineSegments_V2_1_0: export_omf_lineset,
+    Pointset_V1_1_0: export_omf_pointset,
+    Pointset_V1_2_0: export_omf_pointset,
+}
+
+
+async def _download_evo_object_by_id(
     service_client: ObjectAPIClient,
     object_id: UUID,
     version_id: Optional[str] = None,
 ) -> dict[str, Any]:
-    downloaded_object = asyncio.run(service_client.download_object_by_id(object_id, version_id))
+    downloaded_object = await service_client.download_object_by_id(object_id, version_id)
     result: dict[str, Any] = downloaded_object.as_dict()
     return result
 
 
+async def _download_evo_objects(
+    service_client: ObjectAPIClient,
+    objects: list[EvoObjectMetadata],
+    max_concurrent_downloads: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+) -> list[dict[str, Any]]:
+    semaphore = asyncio.Semaphore(max_concurrent_downloads)
+
+    async def _download(object_metadata: EvoObjectMetadata) -> dict[str, Any]:
+        async with semaphore:
+            return await _download_evo_object_by_id(
+                service_client, object_metadata.object_id, object_metadata.version_id
+            )
+
+    # gather() keeps the downloaded objects in the same order as the requested objects
+    return list(await asyncio.gather(*(_download(object_metadata) for object_metadata in objects)))
+
+
 def _export_element(
     object_metadata: EvoObjectMetadata,
-    service_client: ObjectAPIClient,
+    geoscience_object_dict: dict[str, Any],
     data_client: ObjectDataClient,
 ) -> tuple[omf.base.ProjectElement, ObjectSchema]:
     object_id = object_metadata.object_id
     version_id = object_metadata.version_id
 
-    # Download object
-    geoscience_object_dict = _download_evo_object_by_id(service_client, object_id, version_id)
-
     # Check if this is a known geoscience object schema type
     schema = ObjectSchema.from_id(geoscience_object_dict["schema"])
     object_class = schema_lookup.get(str(schema))
@@ -87,18 +114,13 @@ def _export_element(
     geoscience_object = object_class.from_dict(geoscience_object_dict)
 
     # Convert to OMF element
-    match geoscience_object:
-        case TriangleMesh_V2_0_0() | TriangleMesh_V2_1_0():
-            element = export_omf_surface(object_id, version_id, geoscience_object, data_client)
-        case LineSegments_V2_0_0() | LineSegments_V2_1_0():
-            element = export_omf_lineset(object_id, version_id, geoscience_object, data_client)
-        case Pointset_V1_1_0() | Pointset_V1_2_0():
-            element = export_omf_pointset(object_id, version_id, geoscience_object, data_client)
-        case _:
-            raise UnsupportedObjectError(
-                f"Exporting {geoscience_object.__class__.__name__} Geoscience Objects to OMF is not supported"
-            )
+    exporter = _EXPORTERS.get(type(geoscience_object))
+    if exporter is None:
+        raise UnsupportedObjectError(
+            f"Exporting {geoscience_object.__class__.__name__} Geoscience Objects to OMF is not supported"
+        )
 
+    element = exporter(object_id, version_id, geoscience_object, data_client)
     return element, schema
 
 
@@ -128,13 +150,16 @@ def export_omf(
         evo_workspace_metadata, service_manager_widget
     )
 
-    nest_asyncio.apply()
+    allow_nested_event_loop()
 
     omf_metadata = dataclasses.replace(omf_metadata) if omf_metadata else OMFMetadata()
 
+    # Download every object up front in one event loop, the conversions below stay serial as they share its session
+    geoscience_object_dicts = asyncio.run(_download_evo_objects(service_client, objects))
+
     if len(objects) == 1:
         object_metadata = objects[0]
-        element, schema = _export_element(object_metadata, service_client, data_client)
+        element, schema = _export_element(object_metadata, geoscience_object_dicts[0], data_client)
         elements = [element]
 
         # infer project attributes from data
@@ -145,7 +170,10 @@ def export_omf(
             or f"{schema.sub_classification.capitalize()} object with ID {object_metadata.object_id}"
         )
     else:
-        elements = [_export_element(object_metadata, service_client, data_client)[0] for object_metadata in objects]
+        elements = [
+            _export_element(object_metadata, geoscience_object_dict, data_client)[0]
+            for object_metadata, geoscience_object_dict in zip(objects, geoscience_object_dicts)
+        ]
 
         omf_metadata.name = omf_metadata.name or "EvoObjects"
         omf_metadata.description = omf_metadata.description or "Objects with IDs " + ", ".join(
@@ -12,8 +12,9 @@
 from typing import Any, Optional
 from uuid import uuid4
 
+import numpy as np
+import numpy.typing as npt
 import omf2
-import pandas as pd
 import pyarrow as pa
 
 import evo.logging
@@ -33,6 +34,8 @@ from evo.data_converters.omf.importer.blockmodel.utils import (
 
 logger = evo.logging.getLogger("data_converters")
 
+_SUBBLOCK_CORNER_COLUMNS = ["start_si", "start_sj", "start_sk", "end_si", "end_sj", "end_sk"]
+
 
 def create_req_body(
     orient: omf2.Orient3, grid: omf2.Grid3Regular, size_options: dict[str, Any], crs: Crs_V1_0_1
@@ -86,14 +89,21 @@ def extract_regular_block_model_columns(blockmodel: omf2.Element, reader: omf2.R
     ny = grid_count[1]
     nz = grid_count[2]
 
-    df = pd.DataFrame()
+    # Blocks are ordered with k varying fastest, then j, then i
+    i, j, k = np.indices((nx, ny, nz)).reshape(3, -1)
+
+    return add_attribute_columns(blockmodel, reader, {"i": i, "j": j, "k": k})
+
 
-    for i in range(nx):
-        for j in range(ny):
-            for k in range(nz):
-                df = pd.concat([df, pd.DataFrame({"i": [i], "j": [j], "k": [k]})], ignore_index=True)
+def _parent_block_columns(subblock_parent_array: npt.NDArray) -> dict[str, npt.NDArray]:
+    return {"i": subblock_parent_array[:, 0], "j": subblock_parent_array[:, 1], "k": subblock_parent_array[:, 2]}
 
-    return add_attribute_columns(blockmodel, reader, df)
+
+def _is_parent_block(subblock_corners: npt.NDArray, subblock_count: list[int]) -> npt.NDArray[np.bool_]:
+    # A sub-block spanning the whole parent block is the parent block itself
+    return np.all(subblock_corners[:, :3] == 0, axis=1) & np.all(
+        subblock_corners[:, 3:] == np.asarray(subblock_count), axis=1
+    )
 
 
 def extract_variable_octree_block_model_columns(
@@ -106,44 +116,22 @@ def extract_variable_octree_block_model_columns(
     max_depth = get_max_depth(subblocks.count)
     i2s = IndexToSidx(max_depth).create()
 
-    df = pd.DataFrame()
-
-    for idx in range(len(subblock_corner_array)):
-        parent_indices = subblock_parent_array[idx]
-        subblock_corners = subblock_corner_array[idx]
-
-        i = parent_indices[0]
-        j = parent_indices[1]
-        k = parent_indices[2]
+    is_parent_block = _is_parent_block(subblock_corner_array, subblocks.count)
+    sidx = np.zeros(len(subblock_corner_array), dtype=np.uint32)
 
-        i_min = subblock_corners[0]
-        j_min = subblock_corners[1]
-        k_min = subblock_corners[2]
-        i_max = subblock_corners[3]
-        j_max = subblock_corners[4]
-        k_max = subblock_corners[5]
+    for idx in np.flatnonzero(~is_parent_block):
+        i_min, j_min, k_min, i_max, j_max, k_max = subblock_corner_array[idx]
 
         # Calculate sidx
         lvl = calc_level(subblocks.count, i_min, i_max, j_min, j_max, k_min, k_max)
         i_lvl = int(i_min / (i_max - i_min))
         j_lvl = int(j_min / (j_max - j_min))
         k_lvl = int(k_min / (k_max - k_min))
+        sidx[idx] = i2s[lvl][i_lvl, j_lvl, k_lvl]
 
-        if (
-            i_min == 0
-            and i_max == subblocks.count[0]
-            and j_min == 0
-            and j_max == subblocks.count[1]
-            and k_min == 0
-            and k_max == subblocks.count[2]
-        ):
-            sidx = 0  # parent block
-        else:
-            sidx = i2s[lvl][i_lvl, j_lvl, k_lvl]
-
-        df = pd.concat([df, pd.DataFrame({"i": [i], "j": [j], "k": [k], "sidx": [sidx]})], ignore_index=True)
-
-    return add_attribute_columns(blockmodel, reader, df, subblocks)
+    columns = _parent_block_columns(subblock_parent_array)
+    columns["sidx"] = sidx
+    return add_attribute_columns(blockmodel, reader, columns, subblocks)
 
 
 def extract_flexible_block_model_columns(
@@ -153,44 +141,11 @@ def extract_flexible_block_model_columns(
 ) -> pa.Table:
     subblock_parent_array, subblock_corner_array = reader.array_regular_subblocks(subblocks.subblocks)
 
-    df = pd.DataFrame()
-
-    for idx in range(len(subblock_corner_array)):
-        parent_indices = subblock_parent_array[idx]
-        subblock_corners = subblock_corner_array[idx]
-
-        i = parent_indices[0]
-        j = parent_indices[1]
-        k = parent_indices[2]
-
-        i_min = subblock_corners[0]
-        j_min = subblock_corners[1]
-        k_min = subblock_corners[2]
-        i_max = subblock_corners[3]
-        j_max = subblock_corners[4]
-        k_max = subblock_corners[5]
-
-        df = pd.concat(
-            [
-                df,
-                pd.DataFrame(
-                    {
-                        "i": [i],
-                        "j": [j],
-                        "k": [k],
-                        "start_si": [i_min],
-                        "start_sj": [j_min],
-                        "start_sk": [k_min],
-                        "end_si": [i_max],
-                        "end_sj": [j_max],
-                        "end_sk": [k_max],
-                    }
-                ),
-            ],
-            ignore_index=True,
-        )
+    columns = _parent_block_columns(subblock_parent_array)
+    for column, name in enumerate(_SUBBLOCK_CORNER_COLUMNS):
+        columns[name] = subblock_corner_array[:, column]
 
-    return add_attribute_columns(blockmodel, reader, df, subblocks)
+    return add_attribute_columns(blockmodel, reader, columns, subblocks)
 
 
 def extract_fully_sub_blocked_block_model_columns(
@@ -206,57 +161,40 @@ def extract_fully_sub_blocked_block_model_columns(
 
     subblock_parent_array, subblock_corner_array = reader.array_regular_subblocks(subblocks.subblocks)
 
-    df = pd.DataFrame()
-
-    for idx in range(len(subblock_corner_array)):
-        parent_indices = subblock_parent_array[idx]
-        subblock_corners = subblock_corner_array[idx]
-
-        i = parent_indices[0]
-        j = parent_indices[1]
-        k = parent_indices[2]
-
-        i_min = subblock_corners[0]
-        j_min = subblock_corners[1]
-        k_min = subblock_corners[2]
-        i_max = subblock_corners[3]
-        j_max = subblock_corners[4]
-        k_max = subblock_corners[5]
-
-        if (
-            i_min == 0
-            and i_max == subblocks.count[0]
-            and j_min == 0
-            and j_max == subblocks.count[1]
-            and k_min == 0
-            and k_max == subblocks.count[2]
-        ):
-            sidx = 0  # parent block
-        else:
-            sidx = 1 + i_min * nx * ny + j_min * nz + k_min
-
-        df = pd.concat([df, pd.DataFrame({"i": [i], "j": [j], "k": [k], "sidx": [sidx]})], ignore_index=True)
+    # Widen before combining the corners, so the sub-block index can't overflow the corner data type
+    corners = subblock_corner_array.astype(np.int64)
+    i_min = corners[:, 0]
+    j_min = corners[:, 1]
+    k_min = corners[:, 2]
+    sidx = np.where(
+        _is_parent_block(subblock_corner_array, subblocks.count),
+        0,  # parent block
+        1 + i_min * nx * ny + j_min * nz + k_min,
+    )
 
-    return add_attribute_columns(blockmodel, reader, df, subblocks)
+    columns = _parent_block_columns(subblock_parent_array)
+    columns["sidx"] = sidx
+    return add_attribute_columns(blockmodel, reader, columns, subblocks)
 
 
 def add_attribute_columns(
     blockmodel: omf2.Element,
     reader: omf2.Reader,
-    df: pd.DataFrame,
+    columns: dict[str, npt.NDArray],
     subblocks: Optional[omf2.RegularSubblocks] = None,
 ) -> pa.Table:
     # Evo expects block model indices to be uint32 data type, unless they are the flexible subblock columns
     schema_list = []
-    for column in df.columns:
-        if column in ["start_si", "start_sj", "start_sk", "end_si", "end_sj", "end_sk"]:
+    for column in columns:
+        if column in _SUBBLOCK_CORNER_COLUMNS:
             schema_dtype = pa.uint8()
         else:
             schema_dtype = pa.uint32()
         schema_list.append((column, schema_dtype))
     schema = pa.schema(schema_list)
 
-    table = pa.Table.from_pandas(df, schema)
+    # Build the index table in one go from the column arrays, rather than growing it a row at a time
+    table = pa.table(columns, schema=schema)
     location = omf2.Location.Subblocks if subblocks else omf2.Location.Primitives
 
     return convert_omf_blockmodel_attributes_to_columns(blockmodel, reader, table, location)
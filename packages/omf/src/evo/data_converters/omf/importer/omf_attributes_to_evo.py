@@ -16,7 +16,6 @@ from uuid import uuid4
 import numpy as np
 import numpy.typing as npt
 import omf2
-import pandas as pd
 import pyarrow as pa
 from evo_schemas.components import (
     BoolAttribute_V1_1_0,
@@ -42,7 +41,6 @@ from evo_schemas.elements import (
     LookupTable_V1_0_1,
     StringArray_V1_0_1,
 )
-from pandas.api.types import is_datetime64_dtype
 
 import evo.logging
 from evo.objects.utils.data import ObjectDataClient
@@ -148,7 +146,7 @@ def convert_omf_number_attribute(
                 key=str(uuid4()),
                 values=array,
             )
-        case dtype if is_datetime64_dtype(dtype):
+        case dtype if np.issubdtype(dtype, np.datetime64):
             # Other datetimes can be represented with DateTimeAttribute.
             table = pa.Table.from_arrays(
                 [pa.array(numbers, mask=null_mask)],
@@ -180,15 +178,13 @@ def convert_omf_category_attribute(
     indices, null_mask = reader.array_indices(attribute_data.values)
 
     names = reader.array_names(attribute_data.names)
-    table_df = pd.DataFrame({"value": names}).reset_index(names="key")
-
     schema = pa.schema(
         [
             ("key", pa.int64()),
             ("value", pa.string()),
         ]
     )
-    table = pa.Table.from_pandas(table_df, schema=schema)
+    table = pa.Table.from_arrays([pa.array(np.arange(len(names), dtype=np.int64)), pa.array(names)], schema=schema)
     lookup_table_args = data_client.save_table(table)
     lookup_table_go = LookupTable_V1_0_1.from_dict(lookup_table_args)
 
@@ -8,15 +8,15 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Any
+from typing import Any, Optional
 
-import nest_asyncio
 import omf2
 import pyarrow as pa
 
 import evo.logging
 from evo.common import APIConnector, Environment
 from evo.data_converters.common import BlockSyncClient
+from evo.data_converters.common.utils import allow_nested_event_loop
 from evo.objects import ObjectAPIClient
 from evo_schemas.components import Crs_V1_0_1
 
@@ -35,7 +35,12 @@ def _create_block_sync_client(environment: Environment, api_connector: APIConnec
 
 
 def convert_omf_blockmodel(
-    object_service_client: ObjectAPIClient, element: omf2.Element, reader: omf2.Reader, crs: Crs_V1_0_1
+    object_service_client: ObjectAPIClient,
+    element: omf2.Element,
+    reader: omf2.Reader,
+    crs: Crs_V1_0_1,
+    *,
+    geometry: Optional[omf2.BlockModel] = None,
 ) -> list[dict[str, Any]]:
     """Converts an OMF file to BlockSync Objects and creates an empty model on BlockSync.
 
@@ -43,16 +48,18 @@ def convert_omf_blockmodel(
     :param element: The block model element to be processed.
     :param reader: The project reader.
     :param crs: The coordinate reference system.
+    :param geometry: (Optional) The element's geometry, if it has already been read.
 
     If problems are encountered while loading the OMF project, these will be logged as warnings.
     """
     environment = object_service_client._environment
     api_connector = object_service_client._connector
-    nest_asyncio.apply()
+    allow_nested_event_loop()
     block_model_metadata = []
 
     client = _create_block_sync_client(environment, api_connector)
-    geometry = element.geometry()
+    if geometry is None:
+        geometry = element.geometry()
 
     match geometry.grid:
         case omf2.Grid3Tensor():
@@ -9,6 +9,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import Optional
+
+import numpy as np
 import omf2
 import pyarrow as pa
 from evo_schemas.components import (
@@ -23,19 +26,27 @@ import evo.logging
 from evo.objects.utils.data import ObjectDataClient
 from evo.data_converters.common.utils import vertices_bounding_box
 from .omf_attributes_to_evo import convert_omf_attributes
+from .utils import read_world_vertices
 
 logger = evo.logging.getLogger("data_converters")
 
 
 def convert_omf_lineset(
-    lineset: omf2.Element, project: omf2.Project, reader: omf2.Reader, data_client: ObjectDataClient, crs: Crs_V1_0_1
+    lineset: omf2.Element,
+    project: omf2.Project,
+    reader: omf2.Reader,
+    data_client: ObjectDataClient,
+    crs: Crs_V1_0_1,
+    *,
+    geometry: Optional[omf2.LineSet] = None,
 ) -> LineSegments_V2_1_0:
     logger.debug(f'Converting omf2 Element: "{lineset.name}" to LineSegments_V2_0_0.')
 
-    geometry: omf2.LineSet = lineset.geometry()
+    if geometry is None:
+        geometry = lineset.geometry()
 
     # Convert vertices to absolute position in world space by adding the project and geometry origin
-    vertices_array = reader.array_vertices(geometry.vertices) + project.origin + geometry.origin
+    vertices_array = read_world_vertices(reader, geometry.vertices, project.origin, geometry.origin)
     segments_array = reader.array_segments(geometry.segments)
 
     bounding_box_go = vertices_bounding_box(vertices_array)
@@ -50,14 +61,13 @@ def convert_omf_lineset(
 
     segment_indices_schema = pa.schema([pa.field("n0", pa.uint64()), pa.field("n1", pa.uint64())])
 
-    vertices_table = pa.Table.from_arrays(
-        [pa.array(vertices_array[:, i], type=pa.float64()) for i in range(len(vertices_schema))],
-        schema=vertices_schema,
-    )
+    # Transpose once into contiguous columns of the output type, which Arrow wraps without copying
+    vertices = np.ascontiguousarray(vertices_array.T, dtype=np.float64)
+    vertices_table = pa.Table.from_arrays([pa.array(column) for column in vertices], schema=vertices_schema)
 
+    segments = np.ascontiguousarray(segments_array.T, dtype=np.uint64)
     segment_indices_table = pa.Table.from_arrays(
-        [pa.array(segments_array[:, i], type=pa.uint64()) for i in range(len(segment_indices_schema))],
-        schema=segment_indices_schema,
+        [pa.array(column) for column in segments], schema=segment_indices_schema
     )
 
     vertex_attributes_go = convert_omf_attributes(lineset, reader, data_client, omf2.Location.Vertices)
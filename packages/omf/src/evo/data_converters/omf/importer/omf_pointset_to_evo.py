@@ -9,6 +9,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import Optional
+
+import numpy as np
 import omf2
 import pyarrow as pa
 from evo_schemas.elements import FloatArray3_V1_0_1
@@ -20,19 +23,27 @@ from evo.objects.utils.data import ObjectDataClient
 
 from evo.data_converters.common.utils import vertices_bounding_box
 from .omf_attributes_to_evo import convert_omf_attributes
+from .utils import read_world_vertices
 
 logger = evo.logging.getLogger("data_converters")
 
 
 def convert_omf_pointset(
-    pointset: omf2.Element, project: omf2.Project, reader: omf2.Reader, data_client: ObjectDataClient, crs: Crs_V1_0_1
+    pointset: omf2.Element,
+    project: omf2.Project,
+    reader: omf2.Reader,
+    data_client: ObjectDataClient,
+    crs: Crs_V1_0_1,
+    *,
+    geometry: Optional[omf2.PointSet] = None,
 ) -> Pointset_V1_2_0:
     logger.debug(f'Converting omf2 Element: "{pointset.name}" to Pointset_V1_1_0.')
 
-    geometry = pointset.geometry()
+    if geometry is None:
+        geometry = pointset.geometry()
 
     # Convert vertices to absolute position in world space by adding the project and geometry origin
-    vertices_array = reader.array_vertices(geometry.vertices) + project.origin + geometry.origin
+    vertices_array = read_world_vertices(reader, geometry.vertices, project.origin, geometry.origin)
 
     bounding_box_go = vertices_bounding_box(vertices_array)
 
@@ -44,10 +55,9 @@ def convert_omf_pointset(
         ]
     )
 
-    coordinates_table = pa.Table.from_arrays(
-        [pa.array(vertices_array[:, i], type=pa.float64()) for i in range(len(vertices_schema))],
-        schema=vertices_schema,
-    )
+    # Transpose once into contiguous float64 columns, which Arrow wraps without copying
+    coordinates = np.ascontiguousarray(vertices_array.T, dtype=np.float64)
+    coordinates_table = pa.Table.from_arrays([pa.array(column) for column in coordinates], schema=vertices_schema)
     coordinates_args = data_client.save_table(coordinates_table)
     coordinates_go = FloatArray3_V1_0_1.from_dict(coordinates_args)
 
@@ -9,6 +9,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import Optional
+
+import numpy as np
 import omf2
 import pyarrow as pa
 from evo_schemas.components import (
@@ -24,19 +27,27 @@ from evo.objects.utils.data import ObjectDataClient
 
 from evo.data_converters.common.utils import vertices_bounding_box
 from .omf_attributes_to_evo import convert_omf_attributes
+from .utils import read_world_vertices
 
 logger = evo.logging.getLogger("data_converters")
 
 
 def convert_omf_surface(
-    surface: omf2.Element, project: omf2.Project, reader: omf2.Reader, data_client: ObjectDataClient, crs: Crs_V1_0_1
+    surface: omf2.Element,
+    project: omf2.Project,
+    reader: omf2.Reader,
+    data_client: ObjectDataClient,
+    crs: Crs_V1_0_1,
+    *,
+    geometry: Optional[omf2.Surface] = None,
 ) -> TriangleMesh_V2_1_0:
     logger.debug(f'Converting omf2 Element: "{surface.name}" to TriangleMesh_V2_0_0.')
 
-    geometry = surface.geometry()
+    if geometry is None:
+        geometry = surface.geometry()
 
     # Convert vertices to absolute position in world space by adding the project and geometry origin
-    vertices_array = reader.array_vertices(geometry.vertices) + project.origin + geometry.origin
+    vertices_array = read_world_vertices(reader, geometry.vertices, project.origin, geometry.origin)
     indices_array = reader.array_triangles(geometry.triangles)
 
     bounding_box_go = vertices_bounding_box(vertices_array)
@@ -51,15 +62,12 @@ def convert_omf_surface(
 
     indices_schema = pa.schema([pa.field("x", pa.uint64()), pa.field("y", pa.uint64()), pa.field("z", pa.uint64())])
 
-    vertices_table = pa.Table.from_arrays(
-        [pa.array(vertices_array[:, i], type=pa.float64()) for i in range(len(vertices_schema))],
-        schema=vertices_schema,
-    )
+    # Transpose once into contiguous columns of the output type, which Arrow wraps without copying
+    vertices = np.ascontiguousarray(vertices_array.T, dtype=np.float64)
+    vertices_table = pa.Table.from_arrays([pa.array(column) for column in vertices], schema=vertices_schema)
 
-    indices_table = pa.Table.from_arrays(
-        [pa.array(indices_array[:, i], type=pa.uint64()) for i in range(len(indices_schema))],
-        schema=indices_schema,
-    )
+    indices = np.ascontiguousarray(indices_array.T, dtype=np.uint64)
+    indices_table = pa.Table.from_arrays([pa.array(column) for column in indices], schema=indices_schema)
 
     vertex_attributes_go = convert_omf_attributes(surface, reader, data_client, omf2.Location.Vertices)
     triangle_attributes_go = convert_omf_attributes(surface, reader, data_client, omf2.Location.Primitives)
@@ -9,8 +9,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import logging
 import os
-from typing import TYPE_CHECKING, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Optional
 import warnings
 
 import omf2
@@ -24,6 +27,7 @@ from evo.data_converters.common import (
     crs_from_epsg_code,
     crs_from_any,
 )
+from evo.data_converters.common.utils import get_object_tags
 from evo.data_converters.omf import OMFReaderContext
 from evo.objects.data import ObjectMetadata
 
@@ -37,6 +41,16 @@ logger = evo.logging.getLogger("data_converters")
 if TYPE_CHECKING:
     from evo.notebooks import ServiceManagerWidget
 
+# The converter for each OMF geometry type that becomes a Geoscience Object
+_CONVERTERS: dict[type, Callable[..., BaseSpatialDataProperties_V1_0_1]] = {
+    omf2.PointSet: convert_omf_pointset,
+    omf2.Surface: convert_omf_surface,
+    omf2.LineSet: convert_omf_lineset,
+}
+
+# A geometry element's converter, and the index of the element in the project
+_ElementJob = tuple[Callable[..., BaseSpatialDataProperties_V1_0_1], int]
+
 
 def convert_omf(
     filepath: str,
@@ -105,49 +119,64 @@ def convert_omf(
 
     project, problems = reader.project()
 
-    if problems:
-        logger.warning("Problems returned reading OMF project:")
-        for problem in problems:
-            logger.warning(problem)
+    # Log all the problems as one record, and only format them if warnings are actually being logged
+    if problems and logger.isEnabledFor(logging.WARNING):
+        logger.warning("Problems returned reading OMF project:\n%s", "\n".join(map(str, problems)))
 
-    for element in project.elements():
-        geoscience_object = None
+    # Elements are independent of each other, so the geometry elements are converted on a thread pool after working out
+    # what each one is. Block models publish directly to the block model service as they are converted, so they stay
+    # on this thread.
+    element_jobs: list[_ElementJob] = []
+    for index, element in enumerate(project.elements()):
         try:
             geometry = element.geometry()
         except omf2.OmfNotSupportedException:
             logger.warning(f"Trying to load an unsupported geometry type: {element.name}")
             continue
 
-        match geometry:
-            case omf2.PointSet():
-                geoscience_object = convert_omf_pointset(element, project, reader, data_client, crs)
-            case omf2.Surface():
-                geoscience_object = convert_omf_surface(element, project, reader, data_client, crs)
-            case omf2.LineSet():
-                geoscience_object = convert_omf_lineset(element, project, reader, data_client, crs)
-            case omf2.BlockModel():
-                if publish_objects:
-                    block_models = convert_omf_blockmodel(object_service_client, element, reader, crs)
-                else:
-                    logger.warning("Skipping block models due to publish_objects=False")
-            case _:
+        converter = _CONVERTERS.get(type(geometry))
+        if converter is not None:
+            element_jobs.append((converter, index))
+        elif isinstance(geometry, omf2.BlockModel):
+            if publish_objects:
+                block_models = convert_omf_blockmodel(object_service_client, element, reader, crs, geometry=geometry)
+            else:
+                logger.warning("Skipping block models due to publish_objects=False")
+
+    # omf2 readers aren't shared between threads. Each worker opens its own reader on the file and reads the project
+    # from it, so the elements it converts always come from the reader it reads their data with.
+    thread_readers = threading.local()
+
+    def _convert_element(job: _ElementJob) -> Optional[BaseSpatialDataProperties_V1_0_1]:
+        converter, index = job
+        if not hasattr(thread_readers, "reader"):
+            thread_readers.reader = context.new_reader()
+            thread_readers.project, _ = thread_readers.reader.project()
+        element = thread_readers.project.elements()[index]
+        return converter(element, thread_readers.project, thread_readers.reader, data_client, crs)
+
+    # The tags are the same for every object from this file, so build them once, including any custom tags
+    object_tags = get_object_tags(os.path.basename(filepath), "OMF", tags)
+
+    # Tag each object as its conversion completes, rather than collecting all the results first
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        for geoscience_object in executor.map(_convert_element, element_jobs):
+            if not geoscience_object:
                 continue
 
-        if geoscience_object:
-            if geoscience_object.tags is None:
-                geoscience_object.tags = {}
-            geoscience_object.tags["Source"] = f"{os.path.basename(filepath)} (via Evo Data Converters)"
-            geoscience_object.tags["Stage"] = "Experimental"
-            geoscience_object.tags["InputType"] = "OMF"
-
-            # Add custom tags
-            if tags:
-                geoscience_object.tags.update(tags)
+            if geoscience_object.tags:
+                geoscience_object.tags.update(object_tags)
+            else:
+                geoscience_object.tags = dict(object_tags)
 
             geoscience_objects.append(geoscience_object)
 
     objects_metadata = None
-    if publish_objects:
+    if publish_objects and geoscience_objects:
+        # The objects are published in one batch. Their data has already been written to the data client's cache by
+        # save_table, so they only hold references to it. Publishing as a batch also lets generate_paths give objects
+        # with the same name unique paths, and all the uploads share a single event loop. Projects with only block
+        # models, which are already published, or unsupported elements have nothing left to publish here.
         logger.debug("Publishing Geoscience Objects")
         objects_metadata = publish_geoscience_objects_sync(
             geoscience_objects, object_service_client, data_client, upload_path, overwrite_existing_objects
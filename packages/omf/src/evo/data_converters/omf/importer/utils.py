@@ -0,0 +1,37 @@
+#  Copyright © 2025 Bentley Systems, Incorporated
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import omf2
+
+
+def read_world_vertices(reader: omf2.Reader, vertices: Any, *origins: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """Read an OMF vertex array, and convert it to absolute positions in world space.
+
+    The origins are summed into a single offset first, which is then added to the vertices in place, so no
+    temporary vertex arrays are allocated.
+
+    :param reader: The OMF file reader.
+    :param vertices: The OMF vertex array to read.
+    :param origins: The origins to offset the vertices by, usually the project and geometry origins.
+
+    :return: The vertices as an (N, 3) float64 array.
+    """
+    vertices_array = reader.array_vertices(vertices)
+    if vertices_array.dtype != np.float64 or not vertices_array.flags.writeable or not vertices_array.flags.owndata:
+        vertices_array = np.array(vertices_array, dtype=np.float64)
+
+    offset = np.sum(np.asarray(origins, dtype=np.float64), axis=0)
+    np.add(vertices_array, offset, out=vertices_array)
+    return vertices_array
@@ -9,6 +9,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
 from tempfile import NamedTemporaryFile, _TemporaryFileWrapper
 from typing import Optional
 
@@ -18,6 +19,9 @@ import evo.logging
 
 logger = evo.logging.getLogger("data_converters")
 
+# Directory to convert OMF v1 files into when none is passed in, for example a RAM-backed directory like /dev/shm
+OMF_TEMP_DIR_ENV = "EVO_OMF_TEMP_DIR"
+
 
 class OMFReaderContext:
     """OMF Reader Context
@@ -26,15 +30,27 @@ class OMFReaderContext:
 
     If an OMF v1 file is provided, it is automatically converted to a temporary v2 file.
     The temporary file is automatically deleted when this object is garbage collected.
+
+    :param filepath: Path to the OMF file.
+    :param temp_dir: Directory to create the temporary v2 file in. Defaults to the directory set in the
+        EVO_OMF_TEMP_DIR environment variable, or to tempfile.gettempdir() when that isn't set.
     """
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, temp_dir: Optional[str] = None):
         self._temp_file: Optional[_TemporaryFileWrapper] = None
+        self._temp_dir = temp_dir or os.getenv(OMF_TEMP_DIR_ENV) or None
         self._reader = self._load_omf_reader(filepath)
 
     def reader(self) -> omf2.Reader:
         return self._reader
 
+    def new_reader(self) -> omf2.Reader:
+        """Open another omf2.Reader on the same OMF v2 file, for example to read from a different thread.
+
+        An OMF v1 file is not converted again, the new reader uses the same temporary v2 file.
+        """
+        return omf2.Reader(self._filepath)
+
     def temp_file(self) -> Optional[_TemporaryFileWrapper]:
         return self._temp_file
 
@@ -48,7 +64,7 @@ class OMFReaderContext:
         """
         if omf2.detect_omf1(filepath):
             logger.debug(f"{filepath} detected as OMF v1, converting to a temporary v2 file.")
-            self._temp_file = NamedTemporaryFile(mode="w+b", suffix=".omf")
+            self._temp_file = NamedTemporaryFile(mode="w+b", suffix=".omf", dir=self._temp_dir)
             converter = omf2.Omf1Converter()
             converter = self._set_converter_limits(converter)
             converter.convert(filepath, self._temp_file.name)
@@ -57,6 +73,7 @@ class OMFReaderContext:
             filepath = self._temp_file.name
 
         logger.debug(f"Loading omf2.Reader with {filepath}")
+        self._filepath = filepath
         return omf2.Reader(filepath)
 
     def _set_converter_limits(self, converter: omf2.Omf1Converter) -> omf2.Omf1Converter:
@@ -9,11 +9,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
 from os import path
 from pathlib import Path
-from unittest import TestCase
+from tempfile import TemporaryDirectory, gettempdir
+from unittest import TestCase, mock
 
 from evo.data_converters.omf import OMFReaderContext
+from evo.data_converters.omf.omf_reader_context import OMF_TEMP_DIR_ENV
 
 
 class TestOMFReaderContext(TestCase):
@@ -36,3 +39,43 @@ class TestOMFReaderContext(TestCase):
 
         temp_file_exists = Path(temp_file_path).exists()
         self.assertFalse(temp_file_exists, "Temporary file should have been deleted, but it still exists.")
+
+    def test_new_reader_should_open_the_converted_file(self) -> None:
+        omf_filepath = path.join(path.dirname(__file__), "data/pointset_v1.omf")
+        context = OMFReaderContext(omf_filepath)
+
+        reader = context.new_reader()
+        self.assertIsNot(reader, context.reader())
+
+        project, _ = reader.project()
+        expected_project, _ = context.reader().project()
+        self.assertEqual(
+            [element.name for element in expected_project.elements()],
+            [element.name for element in project.elements()],
+        )
+
+    def test_should_convert_omfv1_file_in_default_temp_directory(self) -> None:
+        omf_filepath = path.join(path.dirname(__file__), "data/pointset_v1.omf")
+
+        with mock.patch.dict(os.environ, clear=False) as environ:
+            environ.pop(OMF_TEMP_DIR_ENV, None)
+            context = OMFReaderContext(omf_filepath)
+        self.assertEqual(gettempdir(), path.dirname(context.temp_file().name))
+
+    def test_should_convert_omfv1_file_in_given_temp_directory(self) -> None:
+        omf_filepath = path.join(path.dirname(__file__), "data/pointset_v1.omf")
+
+        with TemporaryDirectory() as temp_dir:
+            context = OMFReaderContext(omf_filepath, temp_dir=temp_dir)
+            self.assertEqual(temp_dir, path.dirname(context.temp_file().name))
+            # Delete the temporary file before its directory is cleaned up
+            del context
+
+    def test_should_convert_omfv1_file_in_temp_directory_from_environment(self) -> None:
+        omf_filepath = path.join(path.dirname(__file__), "data/pointset_v1.omf")
+
+        with TemporaryDirectory() as temp_dir:
+            with mock.patch.dict(os.environ, {OMF_TEMP_DIR_ENV: temp_dir}):
+                context = OMFReaderContext(omf_filepath)
+            self.assertEqual(temp_dir, path.dirname(context.temp_file().name))
+            del context
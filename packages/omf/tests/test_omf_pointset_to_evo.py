@@ -89,3 +89,20 @@ class TestPointsetConverter(TestCase):
         self.assertAlmostEqual(vertices["x"][0].as_py(), 445198.861764)
         self.assertAlmostEqual(vertices["y"][0].as_py(), 494110.588392)
         self.assertAlmostEqual(vertices["z"][0].as_py(), 3052.607678)
+
+    def test_should_use_the_given_geometry(self) -> None:
+        omf_file = path.join(path.dirname(__file__), "data/pointset_v2.omf")
+        context = OMFReaderContext(omf_file)
+        reader = context.reader()
+
+        project, _ = reader.project()
+
+        pointset = project.elements()[0]
+        crs = crs_from_epsg_code(32650)
+
+        pointset_go = convert_omf_pointset(pointset, project, reader, self.data_client, crs)
+        pointset_go_with_geometry = convert_omf_pointset(
+            pointset, project, reader, self.data_client, crs, geometry=pointset.geometry()
+        )
+
+        self.assertEqual(pointset_go, pointset_go_with_geometry)
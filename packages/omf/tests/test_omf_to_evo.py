@@ -12,7 +12,7 @@
 import re
 import tempfile
 from os import path
-from unittest import TestCase
+from unittest import TestCase, mock
 
 import pytest
 from pyproj import CRS
@@ -54,7 +54,7 @@ class TestOMFToEvoProblems:
         expected_log_message = r"WARNING  evo.data_converters:omf_to_evo.py:\d+ Problems returned reading OMF project:"
         assert any(re.search(expected_log_message, line) for line in caplog.text.splitlines())
 
-        expected_log_message = r"WARNING  evo.data_converters:omf_to_evo.py:\d+ Warning: 'Project::elements\[\.\.\]::name' contains duplicate of \"Duplicate\", inside 'Duplicate Element Name Test'"
+        expected_log_message = r"^Warning: 'Project::elements\[\.\.\]::name' contains duplicate of \"Duplicate\", inside 'Duplicate Element Name Test'"
         assert any(re.search(expected_log_message, line) for line in caplog.text.splitlines())
 
 
@@ -93,6 +93,20 @@ class TestOMFToEvoConverter(TestCase):
         expected_go_object_types = [TriangleMesh_V2_1_0, Pointset_V1_2_0, LineSegments_V2_1_0, TriangleMesh_V2_1_0]
         self.assertListEqual(expected_go_object_types, [type(obj) for obj in go_objects])
 
+    def test_should_convert_multiple_elements_on_worker_threads(self) -> None:
+        omf_file = path.join(path.dirname(__file__), "data/one_of_everything.omf")
+
+        converted = {}
+        for workers in (1, 4):
+            with mock.patch("evo.data_converters.omf.importer.omf_to_evo.os.cpu_count", return_value=workers):
+                go_objects = convert_omf(
+                    filepath=omf_file, evo_workspace_metadata=self.metadata, epsg_code=32650, publish_objects=False
+                )
+            converted[workers] = [(type(obj), obj.name, obj.bounding_box) for obj in go_objects]
+
+        self.assertEqual(4, len(converted[4]))
+        self.assertListEqual(converted[1], converted[4])
+
 
 @pytest.mark.parametrize(
     "input_crs, expected_crs",
@@ -10,7 +10,6 @@
 #  limitations under the License.
 
 import contextlib
-import math
 import os
 from collections.abc import Iterator
 from io import TextIOWrapper
@@ -147,7 +146,8 @@ class UBCPropertyFileImporter(UBCFile):
         with self.opened_file() as data_file:
             values_array = numpy.fromfile(data_file, sep="\n", count=n_blocks)
 
-        if len(values_array) != n_blocks or any(math.isinf(value) or math.isnan(value) for value in values_array):
+        # A single vectorised pass, rather than testing each value for inf/nan in Python
+        if len(values_array) != n_blocks or not numpy.isfinite(values_array).all():
             raise UBCInvalidDataError(
                 "Error importing the UBC properties from file: "
                 f"'{self.base_filename}'. "
@@ -18,7 +18,6 @@ import warnings
 from evo_schemas.components import BaseSpatialDataProperties_V1_0_1, Crs_V1_0_1_OgcWkt
 
 import evo.logging
-import nest_asyncio
 from evo.common.exceptions import NotFoundException
 from evo.data_converters.common import (
     EvoWorkspaceMetadata,
@@ -26,6 +25,7 @@ from evo.data_converters.common import (
     crs_from_any,
     crs_from_epsg_code,
 )
+from evo.data_converters.common.utils import allow_nested_event_loop
 from evo.data_converters.ubc.importer import utils
 from evo.objects.data import ObjectMetadata
 
@@ -64,7 +64,7 @@ def _publish_ubc_objects_sync(
     upload_path: str,
     overwrite_existing_objects: bool,
 ) -> list[ObjectMetadata]:
-    nest_asyncio.apply()
+    allow_nested_event_loop()
     objects_metadata: list[ObjectMetadata] = []
 
     for obj, obj_path in zip(geoscience_objects, _generate_publish_paths(geoscience_objects, upload_path)):
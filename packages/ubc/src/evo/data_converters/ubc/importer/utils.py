@@ -10,6 +10,7 @@
 #  limitations under the License.
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import numpy
@@ -32,6 +33,12 @@ from evo.objects.utils.data import ObjectDataClient
 
 logger = evo.logging.getLogger("data_converters")
 
+# UBC meshes are always axis aligned
+_IDENTITY3 = numpy.identity(3)
+_IDENTITY3.flags.writeable = False
+
+_VALUES_SCHEMA = pa.schema([pa.field("values", pa.float64())])
+
 
 def _resolve_coordinate_reference_system(
     epsg_code: Optional[int], coordinate_reference_system: Optional[dict]
@@ -57,18 +64,28 @@ def _resolve_coordinate_reference_system(
 def _create_continuous_attributes(
     data_client: ObjectDataClient, label_to_values: dict
 ) -> list[ContinuousAttribute_V1_1_0]:
-    cell_attributes = []
-    for name, values in label_to_values.items():
-        table = pa.table({"values": values})
-        cell_attributes.append(
-            ContinuousAttribute_V1_1_0(
-                name=name,
-                key=name,
-                nan_description=NanContinuous_V1_0_1(values=[]),
-                values=FloatArray1_V1_0_1(**data_client.save_table(table)),
-            )
+    def _save_values(values: numpy.ndarray) -> dict:
+        # No evo object schemas expect float32, so keep float64 even for float32 sources. The property reader already
+        # returns contiguous float64 values, which Arrow then wraps without copying or inferring the type.
+        values = numpy.ascontiguousarray(values, dtype=numpy.float64)
+        table = pa.Table.from_arrays([pa.array(values)], schema=_VALUES_SCHEMA)
+        return data_client.save_table(table)
+
+    # Each attribute is saved to its own parquet file. They can't be merged into one multi-column table, as a
+    # FloatArray1 has a width of 1 and is referenced by the hash of its own file. Writing them is independent, so save
+    # them concurrently.
+    with ThreadPoolExecutor() as executor:
+        saved_tables = list(executor.map(_save_values, label_to_values.values()))
+
+    return [
+        ContinuousAttribute_V1_1_0(
+            name=name,
+            key=name,
+            nan_description=NanContinuous_V1_0_1(values=[]),
+            values=FloatArray1_V1_0_1(**saved_table),
         )
-    return cell_attributes
+        for name, saved_table in zip(label_to_values, saved_tables)
+    ]
 
 
 def _handle_ubc_files_list(files_path: list[str]) -> tuple[str, list[str]]:
@@ -100,6 +117,12 @@ def get_geoscience_object_from_ubc(
     ubc_mesh_file, ubc_numeric_values_files = _handle_ubc_files_list(files_path)
     name = os.path.splitext(os.path.basename(ubc_mesh_file))[0]
     origin, spacings, size_of_dimensions, _wkt_string = UBCMeshFileImporter(ubc_mesh_file).execute()
+    # The schema stores the cell sizes inline as lists of floats, so the spacings have to be converted with tolist().
+    # Do it straight after reading the mesh, so invalid cell sizes are rejected before any property files are read
+    # and uploaded.
+    grid_cells_3d = Tensor3DGrid_V1_2_0_GridCells3D(
+        cell_sizes_x=spacings[0].tolist(), cell_sizes_y=spacings[1].tolist(), cell_sizes_z=spacings[2].tolist()
+    )
     if coordinate_reference_system is not None or epsg_code is not None:
         resolved_coordinate_reference_system = _resolve_coordinate_reference_system(
             epsg_code, coordinate_reference_system
@@ -115,13 +138,10 @@ def get_geoscience_object_from_ubc(
         values = UBCPropertyFileImporter(value_file).execute(n_blocks, size_of_dimensions)
         numerical_values[os.path.splitext(os.path.basename(value_file))[0]] = values
 
-    bbox = grid_bounding_box(origin, numpy.identity(3), numpy.array([numpy.sum(d) for d in spacings]))
+    extents = numpy.array([spacings[0].sum(), spacings[1].sum(), spacings[2].sum()])
+    bbox = grid_bounding_box(origin, _IDENTITY3, extents)
     cell_attributes = _create_continuous_attributes(data_client, numerical_values)
 
-    grid_cells_3d = Tensor3DGrid_V1_2_0_GridCells3D(
-        cell_sizes_x=spacings[0].tolist(), cell_sizes_y=spacings[1].tolist(), cell_sizes_z=spacings[2].tolist()
-    )
-
     return Tensor3DGrid_V1_2_0(
         name=name,
         origin=origin.tolist(),
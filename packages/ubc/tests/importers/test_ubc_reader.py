@@ -82,6 +82,19 @@ def test_ubc_property_file_importer_run(mock_fromfile: MagicMock, mock_property_
     )
 
 
+@pytest.mark.parametrize("bad_value", [np.nan, np.inf, -np.inf])
+@patch("numpy.fromfile")
+def test_ubc_property_file_importer_rejects_non_finite_values(
+    mock_fromfile: MagicMock, mock_property_file: MagicMock, bad_value: float
+) -> None:
+    values = np.arange(60, dtype=np.float64)
+    values[17] = bad_value
+    mock_fromfile.return_value = values
+    importer = UBCPropertyFileImporter("dummy_property_file.txt")
+    with pytest.raises(UBCInvalidDataError):
+        importer.run(60, [3, 4, 5])
+
+
 def test_ubc_file_opened_file() -> None:
     ubc_file = UBCFile("dummy_file.txt")
     with patch("builtins.open", mock_open(read_data="data")) as mock_file:
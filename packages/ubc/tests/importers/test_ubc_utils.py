@@ -13,11 +13,13 @@ import typing
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pyarrow as pa
 import pytest
 from evo_schemas import Tensor3DGrid_V1_2_0
+from evo_schemas.elements.serialiser import ValidationFailed
 
 from evo.data_converters.common import crs_from_epsg_code
-from evo.data_converters.ubc.importer.utils import get_geoscience_object_from_ubc
+from evo.data_converters.ubc.importer.utils import _create_continuous_attributes, get_geoscience_object_from_ubc
 from evo.objects.utils.data import ObjectDataClient
 
 
@@ -108,6 +110,23 @@ def test_get_geoscience_object_from_ubc_multiple_mesh_files(mock_data_client: Ma
         get_geoscience_object_from_ubc(mock_data_client, files_path, epsg_code)
 
 
+def test_get_geoscience_object_from_ubc_invalid_cell_sizes_skip_properties(
+    mock_data_client: MagicMock, mock_mesh_importer: MagicMock, mock_property_importer: MagicMock
+) -> None:
+    mock_mesh_importer.return_value.execute.return_value = (
+        np.array([1.0, 2.0, 3.0]),
+        [np.array([3.0]), np.array([0.0]), np.array([5.0])],
+        [1, 1, 1],
+        "",
+    )
+
+    with pytest.raises(ValidationFailed):
+        get_geoscience_object_from_ubc(mock_data_client, ["dummy_file.msh", "dummy_values.txt"])
+
+    mock_property_importer.assert_not_called()
+    mock_data_client.save_table.assert_not_called()
+
+
 def test_get_geoscience_object_from_ubc_with_coordinate_reference_system_epsg(
     mock_data_client: MagicMock, mock_mesh_importer: MagicMock, mock_property_importer: MagicMock
 ) -> None:
@@ -196,3 +215,35 @@ def test_get_geoscience_object_from_ubc_uses_unspecified_crs_by_default(
 
     assert isinstance(result, Tensor3DGrid_V1_2_0)
     assert result.coordinate_reference_system == "unspecified"
+
+
+def test_create_continuous_attributes_keeps_attribute_order(mock_data_client: MagicMock) -> None:
+    def save_table(table: pa.Table) -> dict:
+        assert table.schema == pa.schema([("values", pa.float64())])
+        data = f"{int(table['values'][0].as_py()):064x}"
+        return {"data": data, "data_type": "float64", "length": len(table), "width": 1}
+
+    mock_data_client.save_table.side_effect = save_table
+    label_to_values = {f"property_{i}": np.full(4, float(i)) for i in range(8)}
+
+    attributes = _create_continuous_attributes(mock_data_client, label_to_values)
+
+    assert [attribute.name for attribute in attributes] == list(label_to_values)
+    assert [attribute.values.data for attribute in attributes] == [f"{i:064x}" for i in range(8)]
+
+
+def test_create_continuous_attributes_saves_float32_values_as_float64(mock_data_client: MagicMock) -> None:
+    saved_tables = []
+
+    def save_table(table: pa.Table) -> dict:
+        saved_tables.append(table)
+        return {"data": "0" * 64, "data_type": "float64", "length": len(table), "width": 1}
+
+    mock_data_client.save_table.side_effect = save_table
+    values = np.array([1.5, 2.5, np.nan], dtype=np.float32)
+
+    _create_continuous_attributes(mock_data_client, {"property": values})
+
+    assert len(saved_tables) == 1
+    assert saved_tables[0].schema == pa.schema([("values", pa.float64())])
+    assert saved_tables[0]["values"].to_pylist()[:2] == [1.5, 2.5]
@@ -0,0 +1,74 @@
+#  Copyright © 2025 Bentley Systems, Incorporated
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from importlib.util import find_spec
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa
+
+if find_spec("numba") is not None:
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def _pack_masked_values_numba(
+        values: npt.NDArray, mask: npt.NDArray[np.bool_], out: npt.NDArray, validity: npt.NDArray[np.uint8]
+    ) -> None:
+        # Each iteration fills one whole byte of the validity bitmap, and the 8 values it covers, so no two threads
+        # ever write to the same byte. The fixed width inner loop lets the compiler unroll it.
+        n_values = values.size
+        n_full_bytes = n_values // 8
+        for byte in prange(n_full_bytes):
+            start = byte * 8
+            bits = np.uint8(0)
+            for bit in range(8):
+                out[start + bit] = values[start + bit]
+                bits |= np.uint8(mask[start + bit]) << np.uint8(bit)
+            validity[byte] = bits
+
+        # Any trailing values that don't fill a whole byte
+        start = n_full_bytes * 8
+        if start < n_values:
+            bits = np.uint8(0)
+            for bit in range(n_values - start):
+                out[start + bit] = values[start + bit]
+                bits |= np.uint8(mask[start + bit]) << np.uint8(bit)
+            validity[n_full_bytes] = bits
+
+    HAS_NUMBA = True
+else:
+    HAS_NUMBA = False
+
+# Below this size the cost of dispatching to the compiled kernel outweighs the work it saves
+_MIN_NUMBA_SIZE = 1 << 16
+
+
+def pack_masked_values(
+    values: npt.NDArray, mask: npt.NDArray[np.bool_], dtype: np.dtype
+) -> tuple[pa.Buffer, pa.Buffer]:
+    """Convert values to dtype and bit-pack the mask into an Arrow validity bitmap.
+
+    When the values already have the output dtype they are used without copying. Otherwise, with Numba installed,
+    large arrays are converted and packed in a single parallel pass instead of two separate numpy passes.
+
+    :param values: The attribute values.
+    :param mask: True where the value is valid.
+    :param dtype: The numpy dtype of the output values.
+    :return: A tuple of the validity bitmap buffer and the values buffer.
+    """
+    if HAS_NUMBA and values.dtype != dtype and values.size >= _MIN_NUMBA_SIZE:
+        out = np.empty(values.size, dtype=dtype)
+        validity = np.empty((values.size + 7) // 8, dtype=np.uint8)
+        _pack_masked_values_numba(values, mask, out, validity)
+        return pa.py_buffer(validity), pa.py_buffer(out)
+
+    out = np.ascontiguousarray(values.astype(dtype, copy=False))
+    return pa.py_buffer(np.packbits(mask, bitorder="little")), pa.py_buffer(out)
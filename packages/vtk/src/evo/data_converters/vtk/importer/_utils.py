@@ -9,7 +9,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import cast
+import os
+import threading
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import Callable, TypeAlias, TypeVar, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -17,26 +23,47 @@ import pyarrow as pa
 import vtk
 from evo_schemas.components import BoundingBox_V1_0_1, Rotation_V1_1_0, Crs_V1_0_1
 from scipy.spatial.transform import Rotation
-from vtk.util.numpy_support import vtk_to_numpy
+from vtk.util.numpy_support import get_vtk_to_numpy_typemap, vtk_to_numpy
 
+import evo.logging
 from evo.data_converters.common.utils import convert_rotation
 
-
+from ._fast import pack_masked_values
 from .exceptions import GhostValueError
 
+logger = evo.logging.getLogger("data_converters")
+
 
 def get_bounding_box(grid: vtk.vtkDataSet) -> BoundingBox_V1_0_1:
     min_x, max_x, min_y, max_y, min_z, max_z = grid.GetBounds()
     return BoundingBox_V1_0_1(min_x=min_x, max_x=max_x, min_y=min_y, max_y=max_y, min_z=min_z, max_z=max_z)
 
 
+_IDENTITY_MATRIX = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+
+
+@lru_cache(maxsize=128)
+def _rotation_angles(matrix: tuple[float, ...]) -> tuple[float, float, float]:
+    rotation = convert_rotation(Rotation.from_matrix(np.array(matrix, dtype=np.float64).reshape(3, 3)))
+    return rotation.dip_azimuth, rotation.dip, rotation.pitch
+
+
 def get_rotation(vtk_matrix: vtk.vtkMatrix3x3) -> Rotation_V1_1_0:
-    matrix = [[vtk_matrix.GetElement(i, j) for j in range(3)] for i in range(3)]
-    rot = Rotation.from_matrix(matrix)
-    return convert_rotation(rot)
+    # GetData() returns all 9 elements in row-major order in a single call. Blocks in a multi-block dataset usually
+    # share a direction matrix, so the decomposition is cached per distinct matrix. A new Rotation_V1_1_0 is built
+    # each time so that objects never share one.
+    matrix = tuple(vtk_matrix.GetData())
+    if matrix == _IDENTITY_MATRIX:
+        # Unrotated grids are the common case, and need no decomposition
+        return Rotation_V1_1_0(dip_azimuth=0.0, dip=0.0, pitch=0.0)
+    dip_azimuth, dip, pitch = _rotation_angles(matrix)
+    return Rotation_V1_1_0(dip_azimuth=dip_azimuth, dip=dip, pitch=pitch)
 
 
 def check_for_ghosts(dataset: vtk.vtkDataSet) -> npt.NDArray[np.bool_] | None:
+    # Returns a mask that is True for the cells to include, or None if no cells are blank, so callers only need to
+    # check for None to know whether the grid needs masking.
+    #
     # Ghost cells/points, are used for parallel processing, to indicate that cells/points are not in this chunk,
     # but still exist. If any are present, skip this grid as it's not obvious how to handle them.
     #
@@ -52,13 +79,40 @@ def check_for_ghosts(dataset: vtk.vtkDataSet) -> npt.NDArray[np.bool_] | None:
     # Blank cell information is stored in the ghost array
     ghost_array = dataset.GetCellGhostArray()
     if ghost_array is not None:
-        ghosts = vtk_to_numpy(ghost_array)
-        mask: npt.NDArray[np.bool_] = ghosts == 0  # Only include cells that aren't blank
+        # vtk_to_numpy wraps the ghost buffer without copying it. vtkGhostType is always an unsigned char array, so
+        # view it as uint8 and compare in a single pass.
+        ghosts = vtk_to_numpy(ghost_array).view(np.uint8)
+        if not ghosts.any():
+            return None  # No blank cells
+        mask: npt.NDArray[np.bool_] = np.equal(ghosts, 0)  # Only include cells that aren't blank
         return mask
     else:
         return None
 
 
+def inspect_grid(
+    dataset: vtk.vtkDataSet,
+) -> tuple[vtk.vtkCellData, vtk.vtkPointData, npt.NDArray[np.bool_] | None]:
+    """Get the cell data, point data and blank cell mask of a grid in one place.
+
+    :param dataset: The VTK grid to inspect.
+    :return: A tuple of the cell data, the point data and the blank cell mask (None if the grid has no ghost array).
+    """
+    mask = check_for_ghosts(dataset)
+    return dataset.GetCellData(), dataset.GetPointData(), mask
+
+
+def named_attribute_arrays(vtk_data: vtk.vtkDataSetAttributes) -> list[tuple[str, vtk.vtkAbstractArray]]:
+    """List the name and array of each attribute to convert, in order.
+
+    The vtkGhostType array is left out, as ghost and blank cells are handled by check_for_ghosts instead.
+    """
+    get_name = vtk_data.GetArrayName
+    get_array = vtk_data.GetAbstractArray
+    names = [get_name(i) for i in range(vtk_data.GetNumberOfArrays())]
+    return [(name, get_array(i)) for i, name in enumerate(names) if name != "vtkGhostType"]
+
+
 def common_fields(name: str, crs: Crs_V1_0_1, dataset: vtk.vtkDataSet) -> dict:
     bounding_box = get_bounding_box(dataset)
     return {
@@ -69,12 +123,10 @@ def common_fields(name: str, crs: Crs_V1_0_1, dataset: vtk.vtkDataSet) -> dict:
     }
 
 
-def is_float_array(array: vtk.vtkAbstractArray) -> bool:
-    return array.GetDataType() in [vtk.VTK_DOUBLE, vtk.VTK_FLOAT]
-
+_FLOAT_VTK_TYPES = frozenset((vtk.VTK_DOUBLE, vtk.VTK_FLOAT))
 
-def is_integer_array(array: vtk.vtkAbstractArray) -> bool:
-    return array.GetDataType() in [
+_INT_VTK_TYPES = frozenset(
+    (
         vtk.VTK_SIGNED_CHAR,
         vtk.VTK_UNSIGNED_CHAR,
         vtk.VTK_SHORT,
@@ -84,7 +136,40 @@ def is_integer_array(array: vtk.vtkAbstractArray) -> bool:
         vtk.VTK_LONG,
         vtk.VTK_UNSIGNED_LONG,
         vtk.VTK_LONG_LONG,
-    ]
+    )
+)
+
+
+# Integer attributes are stored as int64 if the source values don't fit in an int32, otherwise as int32
+_INT_ATTRIBUTE_DTYPES: dict[int, type[np.signedinteger]] = {
+    vtk_type: np.int64 if np.dtype(get_vtk_to_numpy_typemap()[vtk_type]) in (np.uint32, np.int64) else np.int32
+    for vtk_type in _INT_VTK_TYPES
+}
+
+
+def integer_attribute_dtype(array: vtk.vtkAbstractArray) -> type[np.signedinteger]:
+    """Get the dtype an integer VTK array is stored as, without converting the array to numpy."""
+    return _INT_ATTRIBUTE_DTYPES[array.GetDataType()]
+
+
+_VTK_ARRAY_CLASSES: dict[int, str] = {
+    **{vtk_type: "float" for vtk_type in _FLOAT_VTK_TYPES},
+    **{vtk_type: "int" for vtk_type in _INT_VTK_TYPES},
+    vtk.VTK_STRING: "string",
+}
+
+
+def classify_vtk_array(array: vtk.vtkAbstractArray) -> str:
+    """Classify a VTK array as "float", "int", "string" or "other", with a single GetDataType() call."""
+    return _VTK_ARRAY_CLASSES.get(array.GetDataType(), "other")
+
+
+def is_float_array(array: vtk.vtkAbstractArray) -> bool:
+    return array.GetDataType() in _FLOAT_VTK_TYPES
+
+
+def is_integer_array(array: vtk.vtkAbstractArray) -> bool:
+    return array.GetDataType() in _INT_VTK_TYPES
 
 
 def is_string_array(array: vtk.vtkAbstractArray) -> bool:
@@ -92,16 +177,195 @@ def is_string_array(array: vtk.vtkAbstractArray) -> bool:
     return cast(bool, array.GetDataType() == vtk.VTK_STRING)
 
 
+def string_array_to_arrow(
+    array: vtk.vtkStringArray,
+    mask: npt.NDArray[np.bool_] | None,
+    grid_is_filtered: bool,
+    inv_mask: npt.NDArray[np.bool_] | None = None,
+    mask_indices: npt.NDArray[np.intp] | None = None,
+) -> pa.Array:
+    """Convert a vtkStringArray to an Arrow string array.
+
+    If grid_is_filtered is True, only the values where the mask is True are read, otherwise the values where the mask
+    is False are set to null. inv_mask and mask_indices may be passed to reuse an already inverted mask, or the
+    already computed indices of the True values in the mask.
+
+    VTK has no bulk accessor for string arrays, so the values are streamed into Arrow's builder from a generator;
+    with the size known up front the builder allocates its buffers once.
+    """
+    get_value = array.GetValue
+    if grid_is_filtered and mask is not None:
+        indices = mask_indices if mask_indices is not None else np.flatnonzero(mask)
+        return pa.array((get_value(i) for i in indices), type=pa.string(), size=len(indices))
+
+    n_values = array.GetNumberOfValues()
+    return pa.array(
+        (get_value(i) for i in range(n_values)),
+        type=pa.string(),
+        size=n_values,
+        mask=(inv_mask if inv_mask is not None else ~mask) if mask is not None else None,
+    )
+
+
+_numpy_dtype_for_pyarrow_type = {
+    pa.int32(): np.int32,
+    pa.int64(): np.int64,
+}
+
+
+def string_array_to_category_tables(
+    array: vtk.vtkStringArray,
+    mask: npt.NDArray[np.bool_] | None,
+    grid_is_filtered: bool,
+    inv_mask: npt.NDArray[np.bool_] | None = None,
+    mask_indices: npt.NDArray[np.intp] | None = None,
+) -> tuple[pa.Table, pa.Table]:
+    """Dictionary encode a vtkStringArray into a lookup table and a table of integer keys.
+
+    String attributes are usually low-cardinality labels, so each distinct label is stored once in the lookup table
+    and the values are stored as integer keys into it. Masked out values become null keys.
+
+    :return: A tuple of the lookup table, with "key" and "value" columns, and the values table.
+    """
+    dict_array = string_array_to_arrow(array, mask, grid_is_filtered, inv_mask, mask_indices).dictionary_encode()
+    indices = dict_array.indices
+    dictionary = dict_array.dictionary
+
+    indices_dtype = _numpy_dtype_for_pyarrow_type[indices.type]
+    lookup_table = pa.table({"key": np.arange(len(dictionary), dtype=indices_dtype), "value": dictionary})
+    values_table = pa.table({"values": indices})
+    return lookup_table, values_table
+
+
+TableBuilder: TypeAlias = Callable[[npt.NDArray, npt.NDArray[np.bool_] | None], pa.Table]
+
+
+def _make_table_builder(dtype: np.dtype, masked: bool) -> TableBuilder:
+    """Build a table constructor with the target dtype, and whether a mask is applied, fixed up front."""
+    arrow_type = pa.from_numpy_dtype(dtype)
+
+    # Hand the numpy buffer to Arrow directly, rather than having Arrow copy it into its own allocation. The mask
+    # marks valid values, so it can be bit-packed straight into Arrow's validity bitmap without inverting it first.
+    if masked:
+
+        def build_masked(values: npt.NDArray, mask: npt.NDArray[np.bool_] | None) -> pa.Table:
+            validity, buffer = pack_masked_values(values, cast(npt.NDArray[np.bool_], mask), dtype)
+            array = pa.Array.from_buffers(arrow_type, len(values), [validity, buffer])
+            return pa.table({"values": array})
+
+        return build_masked
+
+    def build(values: npt.NDArray, mask: npt.NDArray[np.bool_] | None) -> pa.Table:
+        values = np.ascontiguousarray(values.astype(dtype, copy=False))
+        array = pa.Array.from_buffers(arrow_type, len(values), [None, pa.py_buffer(values)])
+        return pa.table({"values": array})
+
+    return build
+
+
+_table_builders: dict[tuple[np.dtype, bool], TableBuilder] = {
+    (np.dtype(dtype), masked): _make_table_builder(np.dtype(dtype), masked)
+    for dtype in (np.float64, np.int32, np.int64)
+    for masked in (False, True)
+}
+
+
 def create_table(
     values: npt.NDArray,
     mask: npt.NDArray[np.bool_] | None,
     grid_is_filtered: bool,
     dtype: npt.DTypeLike,
+    mask_indices: npt.NDArray[np.intp] | None = None,
 ) -> pa.Table:
     if grid_is_filtered and mask is not None:
-        values = values[mask]
+        # Gathering by precomputed indices skips the scan of the mask that boolean indexing does for every array
+        values = values.take(mask_indices) if mask_indices is not None else values[mask]
         mask = None  # Don't need to filter the values again
 
-    values = values.astype(dtype)
-    array = pa.array(values, mask=~mask if mask is not None else None)
-    return pa.table({"values": array})
+    dtype = np.dtype(dtype)
+    masked = mask is not None
+    builder = _table_builders.get((dtype, masked))
+    if builder is None:
+        builder = _make_table_builder(dtype, masked)
+    return builder(values, mask)
+
+
+T = TypeVar("T")
+
+# Set on threads that are already converting blocks on a pool, so converting their attributes doesn't start another one
+_attribute_pool_state = threading.local()
+
+
+@contextmanager
+def serial_attribute_conversion() -> Iterator[None]:
+    """Convert the attributes of any grids converted in this block on the current thread, rather than on a pool."""
+    previous = getattr(_attribute_pool_state, "serial", False)
+    _attribute_pool_state.serial = True
+    try:
+        yield
+    finally:
+        _attribute_pool_state.serial = previous
+
+
+def convert_attribute_arrays(
+    vtk_data: vtk.vtkDataSetAttributes,
+    creators: Mapping[str, Callable[..., T]],
+    mask: npt.NDArray[np.bool_] | None = None,
+    grid_is_filtered: bool = False,
+    inv_mask: npt.NDArray[np.bool_] | None = None,
+) -> list[T]:
+    """Convert each supported VTK attribute array with the creator for its array class, keeping the attribute order.
+
+    :param vtk_data: VTK attributes
+    :param creators: The attribute creator for each array class, "float", "int" and "string". Each is called with the
+        name, array, mask and grid_is_filtered, and the mask_indices keyword. The "string" creator is also passed the
+        inv_mask keyword.
+    :param mask: Mask to filter the attribute values
+    :param grid_is_filtered: True if the attribute values should be filtered by the mask, otherwise the
+        attribute values should be set to null where the mask is False.
+    :param inv_mask: (Optional) The inverse of the mask, if the caller has already computed it. Otherwise it is
+        computed once here, and shared by all the attributes.
+    """
+    if vtk_data.GetNumberOfArrays() == 0:
+        return []
+
+    if inv_mask is None and mask is not None and not grid_is_filtered:
+        inv_mask = np.invert(mask)
+
+    # Find the kept values once, rather than every array scanning the mask to filter itself
+    mask_indices = np.flatnonzero(mask) if mask is not None and grid_is_filtered else None
+
+    # Each job is the conversion of one array, and whether it runs on numpy/Arrow buffers rather than Python values
+    jobs: list[tuple[Callable[[], T], bool]] = []
+    for name, array in named_attribute_arrays(vtk_data):
+        if array.GetNumberOfComponents() > 1:
+            logger.warning(f"Attribute {name} has more than one component, skipping this attribute")
+            continue
+
+        array_class = classify_vtk_array(array)
+        create_attribute = creators.get(array_class)
+        if create_attribute is None:
+            logger.warning(
+                f"Unsupported data type {array.GetDataTypeAsString()} for attribute {name}, skipping this attribute"
+            )
+            continue
+
+        if array_class == "string":
+            job = partial(
+                create_attribute, name, array, mask, grid_is_filtered, inv_mask=inv_mask, mask_indices=mask_indices
+            )
+        else:
+            job = partial(create_attribute, name, array, mask, grid_is_filtered, mask_indices=mask_indices)
+        jobs.append((job, array_class != "string"))
+
+    n_numeric = sum(is_numeric for _, is_numeric in jobs)
+    if n_numeric <= 1 or getattr(_attribute_pool_state, "serial", False):
+        return [job() for job, _ in jobs]
+
+    # Numeric arrays are converted by numpy and Arrow, which release the GIL, so they are converted on a pool. String
+    # arrays are read one value at a time in Python, which holds the GIL, so they are converted on this thread while
+    # the pool works.
+    with ThreadPoolExecutor(max_workers=min(n_numeric, os.cpu_count() or 1)) as executor:
+        futures: list[Future[T] | None] = [executor.submit(job) if is_numeric else None for job, is_numeric in jobs]
+        string_results = {i: job() for i, (job, is_numeric) in enumerate(jobs) if not is_numeric}
+        return [string_results[i] if future is None else future.result() for i, future in enumerate(futures)]
@@ -9,9 +9,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from functools import partial
+
 import numpy as np
 import numpy.typing as npt
-import pyarrow as pa
 import vtk
 from evo_schemas.components import (
     CategoryAttribute_V1_1_0,
@@ -24,12 +25,14 @@ from evo_schemas.components import (
 from evo_schemas.elements import FloatArray1_V1_0_1, IntegerArray1_V1_0_1, LookupTable_V1_0_1
 from vtk.util.numpy_support import vtk_to_numpy
 
-import evo.logging
 from evo.objects.utils.data import ObjectDataClient
 
-from ._utils import is_float_array, is_integer_array, is_string_array, create_table
-
-logger = evo.logging.getLogger("data_converters")
+from ._utils import (
+    convert_attribute_arrays,
+    create_table,
+    integer_attribute_dtype,
+    string_array_to_category_tables,
+)
 
 
 def _create_continuous_attribute(
@@ -38,10 +41,11 @@ def _create_continuous_attribute(
     array: vtk.vtkAbstractArray,
     mask: npt.NDArray[np.bool_] | None,
     grid_is_filtered: bool,
+    mask_indices: npt.NDArray[np.intp] | None = None,
 ) -> ContinuousAttribute_V1_1_0:
     values = vtk_to_numpy(array)
     # Convert to float64, as Geoscience Objects only support float64 for continuous attributes
-    table = create_table(values, mask, grid_is_filtered, np.float64)
+    table = create_table(values, mask, grid_is_filtered, np.float64, mask_indices)
     return ContinuousAttribute_V1_1_0(
         name=name,
         key=name,
@@ -56,11 +60,12 @@ def _create_integer_attribute(
     array: vtk.vtkAbstractArray,
     mask: npt.NDArray[np.bool_] | None,
     grid_is_filtered: bool,
+    mask_indices: npt.NDArray[np.intp] | None = None,
 ) -> IntegerAttribute_V1_1_0:
     values = vtk_to_numpy(array)
     # Convert to int32 or int64
-    dtype = np.int64 if values.dtype in [np.uint32, np.int64] else np.int32
-    table = create_table(values, mask, grid_is_filtered, dtype)
+    dtype = integer_attribute_dtype(array)
+    table = create_table(values, mask, grid_is_filtered, dtype, mask_indices)
     return IntegerAttribute_V1_1_0(
         name=name,
         key=name,
@@ -69,36 +74,16 @@ def _create_integer_attribute(
     )
 
 
-_numpy_dtype_for_pyarrow_type = {
-    pa.int32(): np.int32,
-    pa.int64(): np.int64,
-}
-
-
 def _create_categorical_attribute(
     data_client: ObjectDataClient,
     name: str,
     array: vtk.vtkStringArray,
     mask: npt.NDArray[np.bool_] | None,
     grid_is_filtered: bool,
+    inv_mask: npt.NDArray[np.bool_] | None = None,
+    mask_indices: npt.NDArray[np.intp] | None = None,
 ) -> CategoryAttribute_V1_1_0:
-    values = [array.GetValue(i) for i in range(array.GetNumberOfValues())]
-    arrow_array = pa.array(values, mask=~mask if mask is not None else None)
-
-    # Encode the array as a dictionary encoded array
-    dict_array = arrow_array.dictionary_encode()
-
-    indices = dict_array.indices
-    if grid_is_filtered and mask is not None:
-        indices = indices.filter(mask)
-
-    # Create a lookup table
-    indices_dtype = _numpy_dtype_for_pyarrow_type[indices.type]
-    lookup_table = pa.table(
-        {"key": np.arange(len(dict_array.dictionary), dtype=indices_dtype), "value": dict_array.dictionary}
-    )
-
-    values_table = pa.table({"values": indices})
+    lookup_table, values_table = string_array_to_category_tables(array, mask, grid_is_filtered, inv_mask, mask_indices)
     return CategoryAttribute_V1_1_0(
         name=name,
         key=name,
@@ -113,6 +98,7 @@ def convert_attributes(
     data_client: ObjectDataClient,
     mask: npt.NDArray[np.bool_] | None = None,
     grid_is_filtered: bool = False,
+    inv_mask: npt.NDArray[np.bool_] | None = None,
 ) -> OneOfAttribute_V1_2_0:
     """
     Convert VTK attributes to Geoscience Objects attributes.
@@ -122,28 +108,12 @@ def convert_attributes(
     :param mask: Mask to filter the attribute values
     :param grid_is_filtered: True if the attribute values should be filtered by the mask, otherwise the
         attribute values should be set to null where the mask is False.
+    :param inv_mask: (Optional) The inverse of the mask, if the caller has already computed it. Otherwise it is
+        computed once here, and shared by all the attributes.
     """
-    attributes = []
-
-    for i in range(vtk_data.GetNumberOfArrays()):
-        name = vtk_data.GetArrayName(i)
-        if name == "vtkGhostType":
-            continue  # Skip ghost type attribute, we check for ghost cells elsewhere
-        array = vtk_data.GetAbstractArray(i)
-        if array.GetNumberOfComponents() > 1:
-            logger.warning(f"Attribute {name} has more than one component, skipping this attribute")
-            continue
-
-        if is_float_array(array):
-            attribute = _create_continuous_attribute(data_client, name, array, mask, grid_is_filtered)
-        elif is_integer_array(array):
-            attribute = _create_integer_attribute(data_client, name, array, mask, grid_is_filtered)
-        elif is_string_array(array):
-            attribute = _create_categorical_attribute(data_client, name, array, mask, grid_is_filtered)
-        else:
-            logger.warning(
-                f"Unsupported data type {array.GetDataTypeAsString()} for attribute {name}, skipping this attribute"
-            )
-            continue
-        attributes.append(attribute)
-    return attributes
+    creators = {
+        "float": partial(_create_continuous_attribute, data_client),
+        "int": partial(_create_integer_attribute, data_client),
+        "string": partial(_create_categorical_attribute, data_client),
+    }
+    return convert_attribute_arrays(vtk_data, creators, mask, grid_is_filtered, inv_mask)
@@ -13,15 +13,15 @@ from typing import Any, Dict, List
 
 import numpy as np
 import numpy.typing as npt
-import pyarrow as pa
 import vtk
 from vtk.util.numpy_support import vtk_to_numpy
 
-import evo.logging
-
-from ._utils import is_float_array, is_integer_array, is_string_array, create_table
-
-logger = evo.logging.getLogger("data_converters")
+from ._utils import (
+    convert_attribute_arrays,
+    create_table,
+    integer_attribute_dtype,
+    string_array_to_category_tables,
+)
 
 
 def _create_continuous_attribute(
@@ -29,10 +29,11 @@ def _create_continuous_attribute(
     array: vtk.vtkAbstractArray,
     mask: npt.NDArray[np.bool_] | None,
     grid_is_filtered: bool,
+    mask_indices: npt.NDArray[np.intp] | None = None,
 ) -> Dict[str, Any]:
     values = vtk_to_numpy(array)
     # Convert to float64, as Geoscience Objects only support float64 for continuous attributes
-    table = create_table(values, mask, grid_is_filtered, np.float64)
+    table = create_table(values, mask, grid_is_filtered, np.float64, mask_indices)
     return dict(
         name=name,
         values=table,
@@ -44,46 +45,27 @@ def _create_integer_attribute(
     array: vtk.vtkAbstractArray,
     mask: npt.NDArray[np.bool_] | None,
     grid_is_filtered: bool,
+    mask_indices: npt.NDArray[np.intp] | None = None,
 ) -> Dict[str, Any]:
     values = vtk_to_numpy(array)
     # Convert to int32 or int64
-    dtype = np.int64 if values.dtype in [np.uint32, np.int64] else np.int32
-    table = create_table(values, mask, grid_is_filtered, dtype)
+    dtype = integer_attribute_dtype(array)
+    table = create_table(values, mask, grid_is_filtered, dtype, mask_indices)
     return dict(
         name=name,
         values=table,
     )
 
 
-_numpy_dtype_for_pyarrow_type = {
-    pa.int32(): np.int32,
-    pa.int64(): np.int64,
-}
-
-
 def _create_categorical_attribute(
     name: str,
     array: vtk.vtkStringArray,
     mask: npt.NDArray[np.bool_] | None,
     grid_is_filtered: bool,
+    inv_mask: npt.NDArray[np.bool_] | None = None,
+    mask_indices: npt.NDArray[np.intp] | None = None,
 ) -> Dict[str, Any]:
-    values = [array.GetValue(i) for i in range(array.GetNumberOfValues())]
-    arrow_array = pa.array(values, mask=~mask if mask is not None else None)
-
-    # Encode the array as a dictionary encoded array
-    dict_array = arrow_array.dictionary_encode()
-
-    indices = dict_array.indices
-    if grid_is_filtered and mask is not None:
-        indices = indices.filter(mask)
-
-    # Create a lookup table
-    indices_dtype = _numpy_dtype_for_pyarrow_type[indices.type]
-    lookup_table = pa.table(
-        {"key": np.arange(len(dict_array.dictionary), dtype=indices_dtype), "value": dict_array.dictionary}
-    )
-
-    values_table = pa.table({"values": indices})
+    lookup_table, values_table = string_array_to_category_tables(array, mask, grid_is_filtered, inv_mask, mask_indices)
     return dict(
         name=name,
         table=lookup_table,
@@ -95,6 +77,7 @@ def convert_attributes_for_grid(
     vtk_data: vtk.vtkDataSetAttributes,
     mask: npt.NDArray[np.bool_] | None = None,
     grid_is_filtered: bool = False,
+    inv_mask: npt.NDArray[np.bool_] | None = None,
 ) -> List[Dict[str, Any]]:
     """
     Convert VTK attributes to Geoscience Objects attributes.
@@ -104,28 +87,12 @@ def convert_attributes_for_grid(
     :param mask: Mask to filter the attribute values
     :param grid_is_filtered: True if the attribute values should be filtered by the mask, otherwise the
         attribute values should be set to null where the mask is False.
+    :param inv_mask: (Optional) The inverse of the mask, if the caller has already computed it. Otherwise it is
+        computed once here, and shared by all the attributes.
     """
-    attributes = []
-
-    for i in range(vtk_data.GetNumberOfArrays()):
-        name = vtk_data.GetArrayName(i)
-        if name == "vtkGhostType":
-            continue  # Skip ghost type attribute, we check for ghost cells elsewhere
-        array = vtk_data.GetAbstractArray(i)
-        if array.GetNumberOfComponents() > 1:
-            logger.warning(f"Attribute {name} has more than one component, skipping this attribute")
-            continue
-
-        if is_float_array(array):
-            attribute = _create_continuous_attribute(name, array, mask, grid_is_filtered)
-        elif is_integer_array(array):
-            attribute = _create_integer_attribute(name, array, mask, grid_is_filtered)
-        elif is_string_array(array):
-            attribute = _create_categorical_attribute(name, array, mask, grid_is_filtered)
-        else:
-            logger.warning(
-                f"Unsupported data type {array.GetDataTypeAsString()} for attribute {name}, skipping this attribute"
-            )
-            continue
-        attributes.append(attribute)
-    return attributes
+    creators = {
+        "float": _create_continuous_attribute,
+        "int": _create_integer_attribute,
+        "string": _create_categorical_attribute,
+    }
+    return convert_attribute_arrays(vtk_data, creators, mask, grid_is_filtered, inv_mask)
@@ -9,6 +9,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import numpy as np
 import pyarrow as pa
 import vtk
 from evo.data_converters.common import RegularGridData
@@ -19,7 +20,7 @@ from evo_schemas.objects import Regular3DGrid_V1_2_0, RegularMasked3DGrid_V1_2_0
 import evo.logging
 from evo.objects.utils.data import ObjectDataClient
 
-from ._utils import check_for_ghosts, common_fields, get_bounding_box, get_rotation
+from ._utils import common_fields, get_bounding_box, get_rotation, inspect_grid
 from .vtk_attributes_to_evo import convert_attributes
 from .vtk_attributes_to_grid import convert_attributes_for_grid
 
@@ -28,9 +29,9 @@ logger = evo.logging.getLogger("data_converters")
 
 def _extract_vtk_data(image_data: vtk.vtkImageData):
     # GetDimensions returns the number of points in each dimension, so we need to subtract 1 to get the number of cells
-    size = image_data.GetDimensions()
-    size = [dim - 1 for dim in size]
-    spacing = image_data.GetSpacing()
+    nx, ny, nz = image_data.GetDimensions()
+    size = [nx - 1, ny - 1, nz - 1]
+    spacing = list(image_data.GetSpacing())
 
     # VTK supports the origin being offset from the corner of the grid, but Geoscience Objects don't.
     # So, get the location of the corner of grid extent, and use that as the origin.
@@ -38,10 +39,7 @@ def _extract_vtk_data(image_data: vtk.vtkImageData):
     origin = [0.0, 0.0, 0.0]
     image_data.TransformIndexToPhysicalPoint(i1, j1, k1, origin)
 
-    cell_data = image_data.GetCellData()
-    vertex_data = image_data.GetPointData()
-
-    mask = check_for_ghosts(image_data)
+    cell_data, vertex_data, mask = inspect_grid(image_data)
 
     return cell_data, mask, vertex_data, origin, size, spacing
 
@@ -51,15 +49,15 @@ def get_vtk_image_data(image_data: vtk.vtkImageData) -> RegularGridData:
 
     rotation = get_rotation(image_data.GetDirectionMatrix())
     bbox = get_bounding_box(image_data)
-    if mask is not None and not mask.all():
+    if mask is not None:
         if vertex_data.GetNumberOfArrays() > 0:
             logger.warning("Blank cells are not supported with point data, skipping the point data")
 
         cell_attributes = convert_attributes_for_grid(cell_data, mask=mask, grid_is_filtered=True)
         return RegularGridData(
             origin=origin,
-            size=list(size),
-            cell_size=list(spacing),
+            size=size,
+            cell_size=spacing,
             rotation=[rotation.dip_azimuth, rotation.dip, rotation.pitch],
             mask=mask,
             bounding_box=[bbox.min_x, bbox.max_x, bbox.min_y, bbox.max_y, bbox.min_z, bbox.max_z],
@@ -71,8 +69,8 @@ def get_vtk_image_data(image_data: vtk.vtkImageData) -> RegularGridData:
         vertex_attributes = convert_attributes_for_grid(vertex_data)
         return RegularGridData(
             origin=origin,
-            size=list(size),
-            cell_size=list(spacing),
+            size=size,
+            cell_size=spacing,
             rotation=[rotation.dip_azimuth, rotation.dip, rotation.pitch],
             mask=None,
             bounding_box=[bbox.min_x, bbox.max_x, bbox.min_y, bbox.max_y, bbox.min_z, bbox.max_z],
@@ -91,36 +89,42 @@ def convert_vtk_image_data(
     vtkImageData object has any blanked cells.
     """
     cell_data, mask, vertex_data, origin, size, spacing = _extract_vtk_data(image_data)
+    fields = common_fields(name, crs, image_data)
+    rotation = get_rotation(image_data.GetDirectionMatrix())
 
-    if mask is not None and not mask.all():
+    if mask is not None:
         if vertex_data.GetNumberOfArrays() > 0:
             logger.warning("Blank cells are not supported with point data, skipping the point data")
 
         cell_attributes = convert_attributes(cell_data, data_client, mask=mask, grid_is_filtered=True)
+        # Bit-pack the mask into Arrow's boolean layout with numpy, which is much faster than converting it with
+        # pa.array, then wrap the packed buffer without copying it
+        mask_bits = np.packbits(np.asarray(mask, dtype=np.bool_), bitorder="little")
+        mask_array = pa.Array.from_buffers(pa.bool_(), mask.size, [None, pa.py_buffer(mask_bits)])
         mask_attributes = BoolAttribute_V1_1_0(
             name="mask",
             key="mask",
-            values=BoolArray1_V1_0_1(**data_client.save_table(pa.table({"mask": mask}))),
+            values=BoolArray1_V1_0_1(**data_client.save_table(pa.table({"mask": mask_array}))),
         )
         return RegularMasked3DGrid_V1_2_0(
-            **common_fields(name, crs, image_data),
+            **fields,
             origin=origin,
-            size=list(size),
-            cell_size=list(spacing),
-            rotation=get_rotation(image_data.GetDirectionMatrix()),
+            size=size,
+            cell_size=spacing,
+            rotation=rotation,
             cell_attributes=cell_attributes,
             mask=mask_attributes,
-            number_of_active_cells=int(mask.sum()),
+            number_of_active_cells=int(np.count_nonzero(mask)),
         )
     else:
         cell_attributes = convert_attributes(cell_data, data_client)
         vertex_attributes = convert_attributes(vertex_data, data_client)
         return Regular3DGrid_V1_2_0(
-            **common_fields(name, crs, image_data),
+            **fields,
             origin=origin,
-            size=list(size),
-            cell_size=list(spacing),
-            rotation=get_rotation(image_data.GetDirectionMatrix()),
+            size=size,
+            cell_size=spacing,
+            rotation=rotation,
             cell_attributes=cell_attributes,
             vertex_attributes=vertex_attributes,
         )
@@ -10,6 +10,7 @@
 #  limitations under the License.
 
 import numpy as np
+import numpy.typing as npt
 import vtk
 from evo.data_converters.common import TensorGridData
 from evo_schemas.components import Rotation_V1_1_0, Crs_V1_0_1
@@ -19,31 +20,36 @@ from vtk.util.numpy_support import vtk_to_numpy
 import evo.logging
 from evo.objects.utils.data import ObjectDataClient
 
-from ._utils import check_for_ghosts, common_fields, get_bounding_box
+from ._utils import common_fields, get_bounding_box, inspect_grid
 from .vtk_attributes_to_evo import convert_attributes
 from .vtk_attributes_to_grid import convert_attributes_for_grid
 
 logger = evo.logging.getLogger("data_converters")
 
 
+def _cell_sizes(coords: npt.NDArray) -> npt.NDArray:
+    # Subtract adjacent coordinates straight into a preallocated output, using views of the coordinate array
+    sizes = np.empty(max(len(coords) - 1, 0), dtype=coords.dtype)
+    np.subtract(coords[1:], coords[:-1], out=sizes)
+    return sizes
+
+
 def _extract_vtk_data(rectilinear_grid):
     # GetDimensions returns the number of points in each dimension, so we need to subtract 1 to get the number of cells
-    size = rectilinear_grid.GetDimensions()
-    size = [dim - 1 for dim in size]
+    nx, ny, nz = rectilinear_grid.GetDimensions()
+    size = [nx - 1, ny - 1, nz - 1]
 
+    # These are views onto the grid's coordinate arrays, only read while the grid is alive, so they are never copied
     x_coords = vtk_to_numpy(rectilinear_grid.GetXCoordinates())
     y_coords = vtk_to_numpy(rectilinear_grid.GetYCoordinates())
     z_coords = vtk_to_numpy(rectilinear_grid.GetZCoordinates())
 
-    origin = [x_coords[0], y_coords[0], z_coords[0]]
-    x_spacings = np.diff(x_coords)
-    y_spacings = np.diff(y_coords)
-    z_spacings = np.diff(z_coords)
-
-    cell_data = rectilinear_grid.GetCellData()
-    vertex_data = rectilinear_grid.GetPointData()
+    origin = [float(x_coords[0]), float(y_coords[0]), float(z_coords[0])]
+    x_spacings = _cell_sizes(x_coords)
+    y_spacings = _cell_sizes(y_coords)
+    z_spacings = _cell_sizes(z_coords)
 
-    mask = check_for_ghosts(rectilinear_grid)
+    cell_data, vertex_data, mask = inspect_grid(rectilinear_grid)
     return cell_data, mask, vertex_data, origin, size, x_spacings, y_spacings, z_spacings
 
 
@@ -51,7 +57,7 @@ def get_vtk_rectilinear_grid(rectilinear_grid: vtk.vtkRectilinearGrid) -> Tensor
     cell_data, mask, vertex_data, origin, size, x_spacings, y_spacings, z_spacings = _extract_vtk_data(rectilinear_grid)
 
     cell_attributes = convert_attributes_for_grid(cell_data, mask)
-    if mask is not None and not mask.all():
+    if mask is not None:
         if vertex_data.GetNumberOfArrays() > 0:
             logger.warning("Blank cells are not supported with point data, skipping the point data")
         vertex_attributes = []
@@ -63,9 +69,9 @@ def get_vtk_rectilinear_grid(rectilinear_grid: vtk.vtkRectilinearGrid) -> Tensor
         origin=origin,
         size=list(size),
         bounding_box=[bbox.min_x, bbox.max_x, bbox.min_y, bbox.max_y, bbox.min_z, bbox.max_z],
-        cell_sizes_x=list(x_spacings),
-        cell_sizes_y=list(y_spacings),
-        cell_sizes_z=list(z_spacings),
+        cell_sizes_x=x_spacings.tolist(),
+        cell_sizes_y=y_spacings.tolist(),
+        cell_sizes_z=z_spacings.tolist(),
         rotation=np.zeros(3),  # Rectilinear grids don't have rotation
         mask=mask,
         cell_attributes=cell_attributes,
@@ -82,7 +88,7 @@ def convert_vtk_rectilinear_grid(
     cell_data, mask, vertex_data, origin, size, x_spacings, y_spacings, z_spacings = _extract_vtk_data(rectilinear_grid)
 
     cell_attributes = convert_attributes(cell_data, data_client, mask)
-    if mask is not None and not mask.all():
+    if mask is not None:
         if vertex_data.GetNumberOfArrays() > 0:
             logger.warning("Blank cells are not supported with point data, skipping the point data")
         vertex_attributes = []
@@ -94,9 +100,9 @@ def convert_vtk_rectilinear_grid(
         origin=origin,
         size=list(size),
         grid_cells_3d=Tensor3DGrid_V1_2_0_GridCells3D(
-            cell_sizes_x=list(x_spacings),
-            cell_sizes_y=list(y_spacings),
-            cell_sizes_z=list(z_spacings),
+            cell_sizes_x=x_spacings.tolist(),
+            cell_sizes_y=y_spacings.tolist(),
+            cell_sizes_z=z_spacings.tolist(),
         ),
         rotation=Rotation_V1_1_0(dip_azimuth=0.0, dip=0.0, pitch=0.0),  # Rectilinear grids don't have rotation
         cell_attributes=cell_attributes,
@@ -10,11 +10,13 @@
 #  limitations under the License.
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Generator, Optional, TypeAlias
+from typing import TYPE_CHECKING, Callable, Generator, Iterator, Optional, TypeAlias
 import warnings
 
 from evo.data_converters.common.crs import crs_from_any, crs_from_epsg_code
+from evo.data_converters.common.utils import get_object_tags
 import vtk
 from evo_schemas.components import BaseSpatialDataProperties_V1_0_1
 from vtk.util.data_model import ImageData, RectilinearGrid, UnstructuredGrid  # Override classes from vtk
@@ -29,6 +31,7 @@ from evo.data_converters.common import (
 from evo.objects.data import ObjectMetadata
 from evo.objects.utils import ObjectDataClient
 
+from ._utils import serial_attribute_conversion
 from .exceptions import VTKConversionError, VTKImportError
 from .vtk_image_data_to_evo import convert_vtk_image_data, get_vtk_image_data
 from .vtk_rectilinear_grid_to_evo import convert_vtk_rectilinear_grid, get_vtk_rectilinear_grid
@@ -51,14 +54,16 @@ def _get_leaf_objects(data_object: vtk.vtkDataSet, name: str) -> Generator[tuple
         yield name, data_object
 
 
-def _get_data_objects(filepath: str) -> list[tuple[str, vtk.vtkDataObject]]:
+def _get_data_objects(filepath: str) -> Iterator[tuple[str, vtk.vtkDataObject]]:
+    # The file is read straight away, so read errors are raised here, but the leaf blocks are yielded lazily so that
+    # callers can start on the first blocks before the whole block tree has been walked.
     xml_reader = vtk.vtkXMLGenericDataObjectReader()
     xml_reader.SetFileName(filepath)
     xml_reader.Update()
     data_object = xml_reader.GetOutput()
     if not data_object:
         raise VTKImportError(f"Failed to read data object from {filepath}")
-    return list(_get_leaf_objects(data_object, Path(filepath).stem))
+    return _get_leaf_objects(data_object, Path(filepath).stem)
 
 
 GetFunction: TypeAlias = Callable[[vtk.vtkDataObject], BaseGridData]
@@ -94,9 +99,8 @@ def get_vtk_grids(filepath: str) -> list[tuple[str, BaseGridData]]:
     :return: List of (name, BaseGridData) tuples.
     :raise VTKImportError: If the VTK file could not be read.
     """
-    data_objects = _get_data_objects(filepath)
     grid_data_list = []
-    for name, data_object in data_objects:
+    for name, data_object in _get_data_objects(filepath):
         get_function = _get_functions.get(type(data_object))
         if get_function is None:
             logger.warning(f"{type(data_object).__name__} data object are not supported.")
@@ -168,27 +172,46 @@ def convert_vtk(
         evo_workspace_metadata=evo_workspace_metadata, service_manager_widget=service_manager_widget
     )
 
-    data_objects = _get_data_objects(filepath)
-    for name, data_object in data_objects:
+    def _convert_data_object(
+        name_and_data_object: tuple[str, vtk.vtkDataObject],
+    ) -> BaseSpatialDataProperties_V1_0_1 | None:
+        name, data_object = name_and_data_object
         try:
             convert_function = _convert_functions.get(type(data_object))
             if convert_function is None:
                 logger.warning(f"{type(data_object).__name__} data object are not supported.")
-                continue
-            geoscience_object = convert_function(name, data_object, data_client, crs)
+                return None
+            return convert_function(name, data_object, data_client, crs)
         except VTKConversionError as e:
             logger.warning(f"{e}, skipping this grid")
-            continue
+            return None
+
+    def _convert_block(name_and_data_object: tuple[str, vtk.vtkDataObject]) -> BaseSpatialDataProperties_V1_0_1 | None:
+        # The blocks are already spread over the pool, so don't start a nested attribute pool per block
+        with serial_attribute_conversion():
+            return _convert_data_object(name_and_data_object)
+
+    data_objects = list(_get_data_objects(filepath))
+    if len(data_objects) > 1:
+        # Each leaf block is a separate in-memory data object, so the blocks can be converted concurrently. map()
+        # keeps the converted objects in the same order as the blocks in the file.
+        with ThreadPoolExecutor(max_workers=min(len(data_objects), os.cpu_count() or 1)) as executor:
+            converted_objects = list(executor.map(_convert_block, data_objects))
+    else:
+        # A single grid is converted on this thread, so its attributes can still be converted concurrently
+        converted_objects = [_convert_data_object(data_object) for data_object in data_objects]
 
-        if geoscience_object.tags is None:
-            geoscience_object.tags = {}
-        geoscience_object.tags["Source"] = f"{os.path.basename(filepath)} (via Evo Data Converters)"
-        geoscience_object.tags["Stage"] = "Experimental"
-        geoscience_object.tags["InputType"] = "VTK"
+    # The tags are the same for every object from this file, so build them once, including any custom tags
+    object_tags = get_object_tags(os.path.basename(filepath), "VTK", tags)
+
+    for geoscience_object in converted_objects:
+        if geoscience_object is None:
+            continue
 
-        # Add custom tags
-        if tags:
-            geoscience_object.tags.update(tags)
+        if geoscience_object.tags:
+            geoscience_object.tags.update(object_tags)
+        else:
+            geoscience_object.tags = dict(object_tags)
 
         geoscience_objects.append(geoscience_object)
 
@@ -51,9 +51,17 @@ _shape_mapping = {
 }
 
 
+def _as_uint64(values: np.ndarray) -> np.ndarray:
+    # vtk_to_numpy returns a view onto the VTK buffer, so the VTK object must outlive the result and it must not be
+    # written to. Connectivity and offsets are non-negative, so a 64-bit VTK id array can be reinterpreted as unsigned
+    # without copying it; only 32-bit id builds need a converted copy.
+    if values.dtype == np.int64:
+        return values.view(np.uint64)
+    return values.astype(np.uint64)
+
+
 def _create_indices_table(unstructured_grid: vtk.vtkUnstructuredGrid, n_vertices: int) -> pa.Table:
-    connectivity = vtk_to_numpy(unstructured_grid.GetCells().GetConnectivityArray())
-    connectivity = connectivity.astype("uint64")
+    connectivity = _as_uint64(vtk_to_numpy(unstructured_grid.GetCells().GetConnectivityArray()))
     offsets = vtk_to_numpy(unstructured_grid.GetCells().GetOffsetsArray())
     offsets = offsets[:-1]  # Last offset is the total number of indices
     indices_tables = pa.table({f"n{i}": connectivity[offsets + i] for i in range(n_vertices)})
@@ -126,13 +134,13 @@ def _create_generic_unstructured_grid(
     cell_table = pa.table(
         {
             "shape": go_shapes,
-            "offset": offsets[:-1].astype("uint64"),
+            "offset": _as_uint64(offsets[:-1]),
             "n_vertices": np.diff(offsets).astype("int32"),
         }
     )
 
     index_array = vtk_to_numpy(unstructured_grid.GetCells().GetConnectivityArray())
-    index_table = pa.table({"index": index_array.astype("uint64")})
+    index_table = pa.table({"index": _as_uint64(index_array)})
     return UnstructuredGrid_V1_2_0(
         **common_fields(name, crs, unstructured_grid),
         geometry=UnstructuredGridGeometry_V1_2_0(
@@ -157,8 +165,8 @@ def convert_vtk_unstructured_grid(
     _ = check_for_ghosts(unstructured_grid)
 
     vertex_data = unstructured_grid.GetPointData()
-    points = vtk_to_numpy(unstructured_grid.GetPoints().GetData())
-    points = points.astype("float64")
+    # Points are usually already double precision, in which case they are used without a copy
+    points = vtk_to_numpy(unstructured_grid.GetPoints().GetData()).astype(np.float64, copy=False)
     points_table = pa.table({"x": points[:, 0], "y": points[:, 1], "z": points[:, 2]})
     vertex_attributes = convert_attributes(vertex_data, data_client)
 
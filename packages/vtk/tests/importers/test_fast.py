@@ -0,0 +1,44 @@
+#  Copyright © 2025 Bentley Systems, Incorporated
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from evo.data_converters.vtk.importer import _fast
+
+
+@pytest.mark.parametrize("use_numba", [pytest.param(False, id="numpy"), pytest.param(True, id="numba")])
+@pytest.mark.parametrize(
+    "source_dtype, dtype",
+    [
+        pytest.param(np.int8, np.int32, id="int8"),
+        pytest.param(np.int32, np.int32, id="int32"),
+        pytest.param(np.uint32, np.int64, id="uint32"),
+        pytest.param(np.float32, np.float64, id="float32"),
+    ],
+)
+@pytest.mark.parametrize("size", [_fast._MIN_NUMBA_SIZE, _fast._MIN_NUMBA_SIZE + 5])
+def test_pack_masked_values(
+    monkeypatch: pytest.MonkeyPatch, use_numba: bool, source_dtype: type, dtype: type, size: int
+) -> None:
+    if use_numba and not _fast.HAS_NUMBA:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(_fast, "HAS_NUMBA", use_numba)
+
+    rng = np.random.default_rng(42)
+    values = (rng.random(size) * 100).astype(source_dtype)
+    mask = rng.random(size) > 0.3
+
+    validity, buffer = _fast.pack_masked_values(values, mask, np.dtype(dtype))
+    result = pa.Array.from_buffers(pa.from_numpy_dtype(np.dtype(dtype)), size, [validity, buffer])
+
+    assert result.equals(pa.array(values.astype(dtype), mask=~mask))
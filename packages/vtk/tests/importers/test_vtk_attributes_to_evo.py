@@ -10,7 +10,7 @@
 #  limitations under the License.
 
 import uuid
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import numpy.typing as npt
@@ -21,6 +21,7 @@ from evo_schemas.components import CategoryAttribute_V1_1_0
 from vtk.util.numpy_support import numpy_to_vtk
 from vtk_test_helpers import MockDataClient
 
+from evo.data_converters.vtk.importer._utils import serial_attribute_conversion
 from evo.data_converters.vtk.importer.vtk_attributes_to_evo import convert_attributes
 
 
@@ -106,6 +107,55 @@ def test_convert_attributes_with_string_data() -> None:
     assert values_table[0].combine_chunks() == pa.array([0, 1, 2, 0, 0], type=pa.int32())
 
 
+def test_convert_attributes_keeps_attribute_order() -> None:
+    vtk_data = vtk.vtkDataSetAttributes()
+    names = [f"attr_{i}" for i in range(8)]
+    for i, name in enumerate(names):
+        array = numpy_to_vtk(np.full(4, i, dtype=np.float64)) if i % 2 else numpy_to_vtk(np.full(4, i, dtype=np.int32))
+        array.SetName(name)
+        vtk_data.AddArray(array)
+
+    data_client = MockDataClient()
+    result = convert_attributes(vtk_data, data_client)
+    assert [attribute.name for attribute in result] == names
+    for i, attribute in enumerate(result):
+        assert data_client.tables[attribute.values.data][0].to_pylist() == [i] * 4
+
+
+def test_convert_attributes_keeps_attribute_order_with_string_data() -> None:
+    vtk_data = vtk.vtkDataSetAttributes()
+    names = ["float_0", "string_1", "int_2", "string_3", "float_4"]
+    for name in names:
+        if name.startswith("string"):
+            array = _create_string_array(["A", "B", "A"])
+        elif name.startswith("float"):
+            array = numpy_to_vtk(np.full(3, 1.5))
+        else:
+            array = numpy_to_vtk(np.full(3, 2, dtype=np.int32))
+        array.SetName(name)
+        vtk_data.AddArray(array)
+
+    result = convert_attributes(vtk_data, MockDataClient())
+    assert [attribute.name for attribute in result] == names
+    is_category = [isinstance(attribute, CategoryAttribute_V1_1_0) for attribute in result]
+    assert is_category == [False, True, False, True, False]
+
+
+def test_convert_attributes_serially_inside_a_block_pool() -> None:
+    vtk_data = vtk.vtkDataSetAttributes()
+    names = [f"attr_{i}" for i in range(4)]
+    for i, name in enumerate(names):
+        array = numpy_to_vtk(np.full(4, i, dtype=np.float64))
+        array.SetName(name)
+        vtk_data.AddArray(array)
+
+    with patch("evo.data_converters.vtk.importer._utils.ThreadPoolExecutor") as mock_executor:
+        with serial_attribute_conversion():
+            result = convert_attributes(vtk_data, MockDataClient())
+        mock_executor.assert_not_called()
+    assert [attribute.name for attribute in result] == names
+
+
 @pytest.mark.parametrize(
     "array",
     [
@@ -25,25 +25,52 @@ from evo.data_converters.vtk.importer.exceptions import GhostValueError
 from evo.data_converters.vtk.importer.vtk_rectilinear_grid_to_evo import convert_vtk_rectilinear_grid
 
 
+_POINT_DATA = np.linspace(0, 1, 24)
+_CELL_DATA = np.linspace(0, 1, 6)
+
+
+def _wrap_array(vtk_data: vtk.vtkDataObject, values: np.ndarray) -> vtk.vtkDataArray:
+    # Share the numpy buffer with VTK rather than copying it. VTK doesn't own the memory in that case, so keep the
+    # source array alive for as long as the grid is.
+    vtk_data._refs.append(values)
+    return numpy_to_vtk(values, deep=False)
+
+
+def _add_array(
+    vtk_data: vtk.vtkDataObject, attributes: vtk.vtkDataSetAttributes, name: str, values: np.ndarray
+) -> None:
+    vtk_array = _wrap_array(vtk_data, values)
+    vtk_array.SetName(name)
+    attributes.AddArray(vtk_array)
+
+
 def _create_rectilinear_grid() -> vtk.vtkRectilinearGrid:
     vtk_data = vtk.vtkRectilinearGrid()
+    vtk_data._refs = []
     vtk_data.SetDimensions(2, 3, 4)
-    vtk_data.SetXCoordinates(numpy_to_vtk(np.array([2.4, 3.2]), deep=True))
-    vtk_data.SetYCoordinates(numpy_to_vtk(np.array([1.2, 3.3, 5.1]), deep=True))
-    vtk_data.SetZCoordinates(numpy_to_vtk(np.array([-1.3, 0.1, 4.9, 5.0]), deep=True))
+    vtk_data.SetXCoordinates(_wrap_array(vtk_data, np.array([2.4, 3.2])))
+    vtk_data.SetYCoordinates(_wrap_array(vtk_data, np.array([1.2, 3.3, 5.1])))
+    vtk_data.SetZCoordinates(_wrap_array(vtk_data, np.array([-1.3, 0.1, 4.9, 5.0])))
     return vtk_data
 
 
-def test_convert() -> None:
-    vtk_data = _create_rectilinear_grid()
+@pytest.fixture(scope="module")
+def base_grid() -> vtk.vtkRectilinearGrid:
+    return _create_rectilinear_grid()
 
-    point_data = numpy_to_vtk(np.linspace(0, 1, 24), deep=True)
-    point_data.SetName("point_data")
-    vtk_data.GetPointData().AddArray(point_data)
 
-    cell_data = numpy_to_vtk(np.linspace(0, 1, 6), deep=True)
-    cell_data.SetName("cell_data")
-    vtk_data.GetCellData().AddArray(cell_data)
+@pytest.fixture
+def vtk_data(base_grid: vtk.vtkRectilinearGrid) -> vtk.vtkRectilinearGrid:
+    # Each test gets its own copy, as they add arrays to and blank parts of the grid
+    vtk_data = vtk.vtkRectilinearGrid()
+    vtk_data.DeepCopy(base_grid)
+    vtk_data._refs = []
+    return vtk_data
+
+
+def test_convert(vtk_data: vtk.vtkRectilinearGrid) -> None:
+    _add_array(vtk_data, vtk_data.GetPointData(), "point_data", _POINT_DATA)
+    _add_array(vtk_data, vtk_data.GetCellData(), "cell_data", _CELL_DATA)
 
     data_client = MockDataClient()
     result = convert_vtk_rectilinear_grid("Test", vtk_data, crs=crs_from_epsg_code(4326), data_client=data_client)
@@ -61,23 +88,31 @@ def test_convert() -> None:
     assert len(result.vertex_attributes) == 1
     assert result.vertex_attributes[0].name == "point_data"
     point_attribute_table = data_client.tables[result.vertex_attributes[0].values.data]
-    numpy.testing.assert_array_equal(point_attribute_table[0].to_numpy(), np.linspace(0, 1, 24))
+    numpy.testing.assert_array_equal(point_attribute_table[0].to_numpy(), _POINT_DATA)
     assert len(result.cell_attributes) == 1
     assert result.cell_attributes[0].name == "cell_data"
     cell_attribute_table = data_client.tables[result.cell_attributes[0].values.data]
-    numpy.testing.assert_array_equal(cell_attribute_table[0].to_numpy(), np.linspace(0, 1, 6))
+    numpy.testing.assert_array_equal(cell_attribute_table[0].to_numpy(), _CELL_DATA)
 
 
-def test_blanked_cell(caplog: pytest.LogCaptureFixture) -> None:
-    vtk_data = _create_rectilinear_grid()
+def test_convert_float32_coordinates() -> None:
+    vtk_data = vtk.vtkRectilinearGrid()
+    vtk_data._refs = []
+    vtk_data.SetDimensions(2, 3, 2)
+    vtk_data.SetXCoordinates(_wrap_array(vtk_data, np.array([0.0, 0.5], dtype=np.float32)))
+    vtk_data.SetYCoordinates(_wrap_array(vtk_data, np.array([0.0, 1.0, 3.0], dtype=np.float32)))
+    vtk_data.SetZCoordinates(_wrap_array(vtk_data, np.array([-2.0, 2.0], dtype=np.float32)))
+
+    result = convert_vtk_rectilinear_grid("Test", vtk_data, crs=crs_from_epsg_code(4326), data_client=MockDataClient())
+    assert result.grid_cells_3d.cell_sizes_x == [0.5]
+    assert result.grid_cells_3d.cell_sizes_y == [1.0, 2.0]
+    assert result.grid_cells_3d.cell_sizes_z == [4.0]
+    assert all(type(size) is float for size in result.grid_cells_3d.cell_sizes_y)
 
-    point_data = numpy_to_vtk(np.linspace(0, 1, 24), deep=True)
-    point_data.SetName("point_data")
-    vtk_data.GetPointData().AddArray(point_data)
 
-    cell_data = numpy_to_vtk(np.linspace(0, 1, 6), deep=True)
-    cell_data.SetName("cell_data")
-    vtk_data.GetCellData().AddArray(cell_data)
+def test_blanked_cell(caplog: pytest.LogCaptureFixture, vtk_data: vtk.vtkRectilinearGrid) -> None:
+    _add_array(vtk_data, vtk_data.GetPointData(), "point_data", _POINT_DATA)
+    _add_array(vtk_data, vtk_data.GetCellData(), "cell_data", _CELL_DATA)
 
     vtk_data.BlankCell(2)
 
@@ -94,8 +129,7 @@ def test_blanked_cell(caplog: pytest.LogCaptureFixture) -> None:
     assert "Blank cells are not supported with point data, skipping the point dat" in caplog.text
 
 
-def test_blanked_point(caplog: pytest.LogCaptureFixture) -> None:
-    vtk_data = _create_rectilinear_grid()
+def test_blanked_point(caplog: pytest.LogCaptureFixture, vtk_data: vtk.vtkRectilinearGrid) -> None:
     vtk_data.BlankPoint(3)
 
     data_client = MagicMock()
@@ -122,9 +156,13 @@ def test_blanked_point(caplog: pytest.LogCaptureFixture) -> None:
         ),
     ],
 )
-def test_ghost(caplog: pytest.LogCaptureFixture, geometry: int, ghost_value: int, warning_message: str) -> None:
-    vtk_data = _create_rectilinear_grid()
-
+def test_ghost(
+    caplog: pytest.LogCaptureFixture,
+    vtk_data: vtk.vtkRectilinearGrid,
+    geometry: int,
+    ghost_value: int,
+    warning_message: str,
+) -> None:
     add_ghost_value(vtk_data, geometry, ghost_value)
 
     data_client = MagicMock()
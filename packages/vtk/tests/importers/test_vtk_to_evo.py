@@ -10,7 +10,9 @@
 #  limitations under the License.
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from pyproj import CRS
@@ -118,6 +120,26 @@ def test_convert_multiple() -> None:
     assert isinstance(result[2], UnstructuredTetGrid_V1_2_0)
 
 
+def test_convert_single_block_on_calling_thread() -> None:
+    workspace_metadata = EvoWorkspaceMetadata(workspace_id=str(uuid.uuid4()))
+    file_name = this_dir / "data" / "image_data.vti"
+    with patch("evo.data_converters.vtk.importer.vtk_to_evo.ThreadPoolExecutor") as mock_executor:
+        result = convert_vtk(str(file_name), 4326, evo_workspace_metadata=workspace_metadata, publish_objects=False)
+    mock_executor.assert_not_called()
+    assert len(result) == 1
+
+
+def test_convert_multiple_blocks_in_pool() -> None:
+    workspace_metadata = EvoWorkspaceMetadata(workspace_id=str(uuid.uuid4()))
+    file_name = this_dir / "data" / "collection.vtm"
+    with patch(
+        "evo.data_converters.vtk.importer.vtk_to_evo.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+    ) as mock_executor:
+        result = convert_vtk(str(file_name), 4326, evo_workspace_metadata=workspace_metadata, publish_objects=False)
+    mock_executor.assert_called_once()
+    assert len(result) == 3
+
+
 @pytest.mark.parametrize(
     "input_crs, expected_crs",
     [